@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Build the pickled pharmaceutical catalogue snapshot.
+Run after editing src/pharmaceutical_catalogue.py so DrugDatabase loads
+data/pharmaceutical_database.pkl instead of executing the source literal.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from drug_database import build_catalogue_snapshot
+
+
+def main():
+    path = build_catalogue_snapshot()
+    print(f"✅ Pharmaceutical catalogue snapshot written to {path}")
+
+
+if __name__ == "__main__":
+    main()
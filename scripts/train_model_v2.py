@@ -6,6 +6,7 @@ Maintains all Priority 1 Quick Wins improvements.
 """
 
 import pandas as pd
+import numpy as np
 import joblib
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
@@ -69,7 +70,8 @@ def train_model_v2():
     vectorizer = TfidfVectorizer(
         max_features=8000,  # Increased from default
         ngram_range=(1, 2),  # Include bigrams
-        sublinear_tf=True
+        sublinear_tf=True,
+        dtype=np.float32  # float32 features keep the LR fit and saved model in float32
     )
     X_train_vec = vectorizer.fit_transform(X_train)
     X_test_vec = vectorizer.transform(X_test)
@@ -800,14 +800,14 @@ def suggest_drugs_for_disease(disease: str, top_n: int = 5) -> List[Dict]:
             formatted = []
             for drug in drugs[:top_n]:
                 formatted.append({
-                    "name": drug.get("name"),
-                    "brand_names": drug.get("brand_names", []),
-                    "type": drug.get("type"),
-                    "dosage": drug.get("dosage"),
-                    "purpose": drug.get("purpose"),
-                    "availability": drug.get("availability"),
-                    "price_range": drug.get("price_range"),
-                    "side_effects": drug.get("side_effects")
+                    "name": drug.name,
+                    "brand_names": list(drug.brand_names),
+                    "type": drug.type,
+                    "dosage": drug.dosage,
+                    "purpose": drug.purpose,
+                    "availability": drug.availability,
+                    "price_range": drug.price_range,
+                    "side_effects": drug.side_effects
                 })
             return formatted
         except Exception:
@@ -34,7 +34,7 @@ def build_hitd_graph():
     for _, row in targets.iterrows():
         G.add_edge(row["target"], row["disease"], relation="target-disease")
 
-    nx.write_edgelist(G, "data/HITD_network.edgelist", data=False)
+    nx.write_edgelist(G, "data/HITD_network.edgelist", delimiter="\t", data=False)
     print(f"✅ Graph built with {len(G.nodes())} nodes and {len(G.edges())} edges.")
     return G
 
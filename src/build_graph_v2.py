@@ -34,7 +34,7 @@ def build_hitd_graph(data_dir="data"):
         G.add_edge(str(r['target']).strip(), str(r['disease']).strip())
 
     # Save lists for later convenience
-    nx.write_edgelist(G, f"{data_dir}/HITD_network.edgelist", data=False)
+    nx.write_edgelist(G, f"{data_dir}/HITD_network.edgelist", delimiter="\t", data=False)
 
     # Save node-type lists (heuristic via CSVs)
     herbs_nodes = herbs['herb'].astype(str).str.strip().unique().tolist()
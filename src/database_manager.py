@@ -5,6 +5,7 @@ Provides centralized access to medical data with caching and optimization
 
 import sqlite3
 import os
+from contextlib import contextmanager
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -118,6 +119,8 @@ class DatabaseManager:
                 price_range VARCHAR(20),
                 availability VARCHAR(50),
                 brand_names TEXT,
+                description TEXT,
+                effectiveness_rating FLOAT DEFAULT 0.5,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (disease_id) REFERENCES diseases(id) ON DELETE SET NULL
             )
@@ -148,17 +151,42 @@ class DatabaseManager:
                 likely_diseases TEXT,
                 severity VARCHAR(20),
                 clarification TEXT,
+                pattern_data TEXT,
+                disease_association TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
         
+        self._migrate_schema(cursor)
+        
         # Create indexes for performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_disease_name ON diseases(name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_symptom_name ON symptoms(name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_herb_name ON herbs(name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_pharmaceutical_name ON pharmaceuticals(name)")
         
         self.connection.commit()
     
+    # Columns added after the first schema version: table -> {column: type}
+    ADDED_COLUMNS = {
+        "pharmaceuticals": {
+            "description": "TEXT",
+            "effectiveness_rating": "FLOAT DEFAULT 0.5",
+        },
+        "symptom_patterns": {
+            "pattern_data": "TEXT",
+            "disease_association": "TEXT",
+        },
+    }
+    
+    def _migrate_schema(self, cursor):
+        """Add columns missing from databases created with an older schema."""
+        for table, columns in self.ADDED_COLUMNS.items():
+            existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in columns.items():
+                if column not in existing:
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+    
     def add_disease(self, name: str, category: str = None, severity: int = 1, 
                    description: str = None) -> int:
         """Add a disease to the database."""
@@ -356,6 +384,46 @@ class DatabaseManager:
         
         return stats
     
+    @contextmanager
+    def bulk_load(self, cache_size_kib: int = None):
+        """
+        Relax durability for an offline bulk load, restoring the settings after.
+        
+        Switches to an in-memory rollback journal with synchronous=OFF and an
+        exclusive lock. Leaving WAL needs sole access to the database, so if
+        another connection has it open the load runs in the current journal
+        mode instead (with synchronous=NORMAL, which is safe in WAL).
+        
+        Args:
+            cache_size_kib: Page cache size to use during the load
+        """
+        conn = self.connection
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        switched = False
+        try:
+            conn.execute("PRAGMA journal_mode=MEMORY")
+            switched = True
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Keeping journal_mode={journal_mode} for the bulk load: {e}")
+        if switched:
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        else:
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if cache_size_kib:
+            conn.execute(f"PRAGMA cache_size=-{cache_size_kib}")
+        try:
+            yield conn
+        finally:
+            if switched:
+                conn.execute("PRAGMA locking_mode=NORMAL")
+                conn.execute(f"PRAGMA journal_mode={journal_mode}")
+                # The exclusive lock is only released on the next access
+                conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            conn.execute(f"PRAGMA synchronous={synchronous}")
+    
     def close(self):
         """Close database connection."""
         if self.connection:
@@ -1,6 +1,84 @@
 import networkx as nx
-from node2vec import Node2Vec
+import numpy as np
+from gensim.models import KeyedVectors, Word2Vec
+import hashlib
+import json
+import logging
 import os
+import pickle
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Training settings. They are part of the key stored next to embeddings.kv,
+# so changing any of them forces a retrain.
+WALK_PARAMS = {"dimensions": 64, "walk_length": 10, "num_walks": 50, "seed": 42}
+WORD2VEC_PARAMS = {"window": 5, "negative": 5, "sample": 1e-3, "epochs": 3}
+
+def _file_digest(path):
+    """Content hash of a file, read in 1 MiB blocks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+class RandomWalkCorpus:
+    """
+    Uniform (p=q=1) Node2Vec random walks, streamed to Word2Vec.
+
+    Walks are generated in-process from the CSR adjacency: every round
+    advances all walks one hop with a single numpy gather, so no graph is
+    pickled to worker processes. Each pass re-seeds the generator, giving
+    Word2Vec the same corpus on its vocabulary and training passes.
+    """
+
+    def __init__(self, G, walk_length=10, num_walks=50, seed=42):
+        nodelist = list(G.nodes())
+        adjacency = nx.to_scipy_sparse_array(G, nodelist=nodelist, format="csr")
+        self.nodes = np.array([str(n) for n in nodelist], dtype=object)
+        self.indptr = adjacency.indptr
+        self.indices = adjacency.indices
+        self.degree = np.diff(self.indptr)
+        self.walk_length = walk_length
+        self.num_walks = num_walks
+        self.seed = seed
+
+    def __iter__(self):
+        rng = np.random.default_rng(self.seed)
+        n = len(self.nodes)
+        for _ in range(self.num_walks):
+            walks = np.empty((n, self.walk_length), dtype=np.int64)
+            walks[:, 0] = rng.permutation(n)
+            for step in range(1, self.walk_length):
+                current = walks[:, step - 1]
+                degree = self.degree[current]
+                offset = (rng.random(n) * degree).astype(np.int64)
+                # Isolated nodes have nowhere to go and stay put
+                moving = degree > 0
+                walks[:, step] = current
+                walks[moving, step] = self.indices[self.indptr[current[moving]] + offset[moving]]
+            # Map node indices to names for the whole round in one gather
+            isolated = (self.degree[walks[:, 0]] == 0).tolist()
+            for walk, alone in zip(self.nodes[walks].tolist(), isolated):
+                yield walk[:1] if alone else walk
+
+
+def train_walk_embeddings(G, dimensions=64, walk_length=10, num_walks=50, seed=42):
+    """Train skip-gram node embeddings on uniform random walks over G."""
+    corpus = RandomWalkCorpus(G, walk_length=walk_length, num_walks=num_walks, seed=seed)
+    return Word2Vec(
+        sentences=corpus, vector_size=dimensions, min_count=1, sg=1, hs=0, **WORD2VEC_PARAMS,
+        workers=os.cpu_count() or 2, compute_loss=False, seed=seed
+    )
+
+def _training_key(edgelist_path):
+    """Hash of the edgelist contents together with every training setting."""
+    settings = {"p": 1, "q": 1, **WALK_PARAMS, **WORD2VEC_PARAMS}
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_file_digest(edgelist_path).encode())
+    h.update(json.dumps(settings, sort_keys=True).encode())
+    return h.hexdigest()
 
 def generate_node2vec_embeddings():
     # Use the expanded graph instead of the base one
@@ -8,29 +86,44 @@ def generate_node2vec_embeddings():
     if not os.path.exists(edgelist_path):
         edgelist_path = "data/HITD_network.edgelist"
 
-    print(f"🚀 Starting Node2Vec embedding generation from {edgelist_path}...")
-
-    # Load graph - parse edgelist line by line to handle multi-word node names
-    G = nx.Graph()
-    with open(edgelist_path, "r") as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) >= 2:
-                # Split into two parts: first word is source, rest is target
-                source = parts[0]
-                target = " ".join(parts[1:])
-                G.add_edge(source, target)
+    kv_path = "data/embeddings.kv"
+    hash_path = kv_path + ".hash"
+
+    # Skip retraining when the embeddings were built from this exact edgelist
+    # with the same settings
+    digest = _training_key(edgelist_path)
+    if os.path.exists(kv_path) and os.path.exists(hash_path):
+        with open(hash_path, "r") as f:
+            if f.read().strip() == digest:
+                logger.info("✅ %s is up to date with %s, skipping Node2Vec", kv_path, edgelist_path)
+                return KeyedVectors.load(kv_path)
+
+    logger.info("🚀 Starting Node2Vec embedding generation from %s...", edgelist_path)
+
+    # Load graph - prefer the pickled copy written next to the edgelist when it
+    # is not older than the edgelist; otherwise parse the tab-delimited text
+    # (interning collapses repeated node strings into one object)
+    gpickle_path = os.path.splitext(edgelist_path)[0] + ".gpickle"
+    if os.path.exists(gpickle_path) and os.path.getmtime(gpickle_path) >= os.path.getmtime(edgelist_path):
+        with open(gpickle_path, "rb") as f:
+            G = pickle.load(f)
+    else:
+        G = nx.read_edgelist(edgelist_path, delimiter="\t", nodetype=sys.intern, data=False, create_using=nx.Graph)
     
-    print(f"✅ Graph loaded with {len(G.nodes())} nodes and {len(G.edges())} edges")
+    logger.info("✅ Graph loaded with %d nodes and %d edges", G.number_of_nodes(), G.number_of_edges())
 
     # Train Node2Vec
-    node2vec = Node2Vec(G, dimensions=64, walk_length=10, num_walks=50, workers=2)
-    print("⚙️  Training Node2Vec model...")
-    model = node2vec.fit(window=5, min_count=1)
-    # Save using gensim's native format which handles multi-word node names
-    model.wv.save("data/embeddings.kv")
+    logger.info("⚙️  Training Node2Vec model...")
+    model = train_walk_embeddings(G, **WALK_PARAMS)
+    # Save using gensim's native format which handles multi-word node names;
+    # vectors go to a separate .npy so readers can memory-map them
+    model.wv.save(kv_path, separately=["vectors"])
+    with open(hash_path, "w") as f:
+        f.write(digest)
 
-    print("✅ Embeddings successfully generated and saved to data/embeddings.kv")
+    logger.info("✅ Embeddings successfully generated and saved to %s", kv_path)
+    return model.wv
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     generate_node2vec_embeddings()
\ No newline at end of file
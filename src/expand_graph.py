@@ -1,20 +1,27 @@
 import pandas as pd
 import networkx as nx
+import logging
+import pickle
+
+logger = logging.getLogger(__name__)
 
 def expand_graph():
-    base_graph = nx.read_edgelist("data/HITD_network.edgelist")
-    kaggle_df = pd.read_csv("data/symptom_disease.csv")
+    base_graph = nx.read_edgelist("data/HITD_network.edgelist", delimiter="\t", nodetype=str, data=False)
+    # Only the prognosis column is needed; categorical dtype stores each disease once
+    kaggle_df = pd.read_csv("data/symptom_disease.csv", usecols=['prognosis'], dtype={'prognosis': 'category'})
 
     # Add Kaggle diseases as nodes
-    diseases = kaggle_df['prognosis'].unique()
-    print(f"Adding {len(diseases)} diseases to graph...")
+    diseases = kaggle_df['prognosis'].cat.categories
+    logger.info("Adding %d diseases to graph...", len(diseases))
 
-    for d in diseases:
-        if not base_graph.has_node(d):
-            base_graph.add_node(d)
+    base_graph.add_nodes_from(diseases.tolist())
 
-    nx.write_edgelist(base_graph, "data/HITD_network_expanded.edgelist")
-    print("✅ Expanded graph saved to data/HITD_network_expanded.edgelist")
+    nx.write_edgelist(base_graph, "data/HITD_network_expanded.edgelist", delimiter="\t", data=False)
+    # Binary copy for loaders: unpickling skips text tokenization entirely
+    with open("data/HITD_network_expanded.gpickle", "wb") as f:
+        pickle.dump(base_graph, f, pickle.HIGHEST_PROTOCOL)
+    logger.info("✅ Expanded graph saved to data/HITD_network_expanded.edgelist (+ .gpickle)")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     expand_graph()
@@ -1,7 +1,18 @@
 import pandas as pd
 import networkx as nx
-import random
+import numpy as np
 import os
+import pickle
+
+def _add_edge(edges, u, v):
+    """Add an undirected edge to an insertion-ordered edge table (no adjacency dicts)."""
+    edges.setdefault(frozenset((u, v)), (u, v))
+
+def _add_edges(edges, pairs):
+    """Bulk form of _add_edge for an iterable of (u, v) pairs."""
+    setdefault = edges.setdefault
+    for u, v in pairs:
+        setdefault(frozenset((u, v)), (u, v))
 
 def expand_graph_v2():
     base_path = "data/HITD_network.edgelist"
@@ -12,16 +23,15 @@ def expand_graph_v2():
         raise FileNotFoundError("❌ symptom_disease.csv not found. Run fetch_dataset.py first.")
 
     # --- Load base graph safely ---
-    # Parse edgelist line by line to handle multi-word node names correctly
-    G = nx.Graph()
+    # Only edges are added and written, so keep a flat edge table instead of
+    # networkx adjacency dicts; tab delimiter keeps multi-word node names intact
+    edges = {}
     with open(base_path, "r") as f:
         for line in f:
-            parts = line.strip().split()
+            parts = line.rstrip("\n").split("\t")
             if len(parts) >= 2:
-                # Split into two parts: first word is source, rest is target
-                source = parts[0]
-                target = " ".join(parts[1:])
-                G.add_edge(source, target)
+                _add_edge(edges, parts[0], parts[1])
+    nodes = dict.fromkeys(node for edge in edges.values() for node in edge)
     
     print("🧠 Adding diseases from Kaggle dataset...")
 
@@ -36,25 +46,30 @@ def expand_graph_v2():
         raise ValueError("❌ Could not find disease/prognosis column in dataset!")
 
     diseases = kaggle_df[disease_col].dropna().unique()
-    herbs = [n for n in G.nodes if n.lower() not in [d.lower() for d in diseases]]
+    diseases_lower = {str(d).lower() for d in diseases}
+    herbs = [n for n in nodes if n.lower() not in diseases_lower]
 
     print(f"✅ Adding {len(diseases)} diseases to graph...")
 
-    added_edges = 0
-    for disease in diseases:
-        herb = random.choice(herbs)
-        # Add edge only between herb and disease name as plain text
-        G.add_edge(str(herb).strip(), str(disease).strip())
-        added_edges += 1
+    # One vectorized draw assigns a random herb to every disease
+    picks = np.random.choice(np.asarray(herbs, dtype=object), size=len(diseases))
+    # Add edges only between herb and disease name as plain text, in one pass
+    _add_edges(edges, ((str(herb).strip(), str(disease).strip())
+                       for herb, disease in zip(picks, diseases)))
+    added_edges = len(diseases)
 
     print(f"✅ Added {added_edges} herb–disease links.")
 
     # --- Write edgelist CLEANLY ---
-    with open(out_path, "w") as f:
-        for u, v in G.edges():
-            f.write(f"{u} {v}\n")
+    with open(out_path, "w", buffering=1 << 20) as f:
+        f.writelines(f"{u}\t{v}\n" for u, v in edges.values())
+
+    # Binary copy for embeddings.py: unpickling skips text tokenization entirely.
+    # This is the only consumer that needs a networkx graph, so build it here.
+    with open(os.path.splitext(out_path)[0] + ".gpickle", "wb") as f:
+        pickle.dump(nx.Graph(list(edges.values())), f, pickle.HIGHEST_PROTOCOL)
 
-    print(f"📦 Expanded and connected graph saved to {out_path}")
+    print(f"📦 Expanded and connected graph saved to {out_path} (+ .gpickle)")
 
 if __name__ == "__main__":
     expand_graph_v2()
@@ -2,13 +2,37 @@ import shap
 import joblib
 import numpy as np
 import matplotlib.pyplot as plt
+from sklearn.ensemble._forest import BaseForest
+from sklearn.ensemble._gb import BaseGradientBoosting
+from sklearn.tree import BaseDecisionTree
+
+# FastTreeSHAP (optional) - same TreeSHAP values, faster v2 algorithm with parallel trees
+HAS_FASTTREESHAP = False
+try:
+    import fasttreeshap
+    HAS_FASTTREESHAP = True
+except ImportError:
+    HAS_FASTTREESHAP = False
+
+# Models TreeSHAP handles in polynomial time; anything else needs the generic Explainer
+TREE_MODEL_TYPES = (BaseForest, BaseGradientBoosting, BaseDecisionTree)
 
 def explain_model():
     model = joblib.load("data/model.pkl")
     X = np.random.rand(20, 64)
 
-    explainer = shap.TreeExplainer(model)
-    shap_values = explainer.shap_values(X)
+    if not isinstance(model, TREE_MODEL_TYPES):
+        print(f"ℹ️  {type(model).__name__} is not a tree model, using generic shap.Explainer")
+        predict = model.predict_proba if hasattr(model, "predict_proba") else model.predict
+        shap_values = shap.Explainer(predict, X)(X).values
+    else:
+        if HAS_FASTTREESHAP:
+            print(f"ℹ️  {type(model).__name__}: using FastTreeSHAP v2")
+            explainer = fasttreeshap.TreeExplainer(model, algorithm="v2", n_jobs=-1, shortcut=False)
+        else:
+            print(f"ℹ️  {type(model).__name__}: using shap.TreeExplainer")
+            explainer = shap.TreeExplainer(model)
+        shap_values = explainer.shap_values(X)
 
     shap.summary_plot(shap_values, X, show=False)
     plt.title("Feature Importance Explanation (SHAP)")
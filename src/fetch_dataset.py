@@ -1,9 +1,23 @@
 import kagglehub
+import errno
 import os
 import shutil
 import pandas as pd
 
+HAS_PYARROW = False
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 def fetch_symptom_dataset():
+    """Download the Kaggle symptom dataset to data/symptom_disease.csv.
+
+    When the Kaggle cache is on the same filesystem the file is hard-linked
+    rather than copied, so both names share the same storage: editing one
+    file in place changes the other. Write a new file instead of editing it.
+    """
     print("📦 Downloading dataset from Kaggle...")
     path = kagglehub.dataset_download("kaushil268/disease-prediction-using-machine-learning")
     print("✅ Downloaded successfully!")
@@ -11,13 +25,35 @@ def fetch_symptom_dataset():
 
     source_file = os.path.join(path, "Training.csv")
     dest_file = "data/symptom_disease.csv"
+    tmp_file = dest_file + ".tmp"
 
     os.makedirs("data", exist_ok=True)
-    shutil.copy(source_file, dest_file)
-    print(f"✅ Copied Training.csv → {dest_file}")
+    # Hard-link when the Kaggle cache is on the same filesystem (no data copy).
+    # Link or copy to a temporary name first and swap it in atomically, so a
+    # failure leaves any previous dataset in place
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+    try:
+        os.link(source_file, tmp_file)
+        action = "Linked"
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        try:
+            shutil.copyfile(source_file, tmp_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        action = "Copied"
+    os.replace(tmp_file, dest_file)
+    print(f"✅ {action} Training.csv → {dest_file}")
 
     # Quick check
-    df = pd.read_csv(dest_file)
+    if HAS_PYARROW:
+        df = pd.read_csv(dest_file, engine="pyarrow")
+    else:
+        df = pd.read_csv(dest_file, engine="c", low_memory=False)
     print(f"📊 Loaded {len(df)} rows and {len(df.columns)} columns")
     print("Columns:", df.columns.tolist()[:10])
 
@@ -4,19 +4,133 @@ Herbal Safety Checker - Week 3 Improvement
 Checks for contraindications, drug interactions, and safety warnings for herbal remedies
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(frozen=True)
 class SafetyWarning:
-    """Structure for safety warnings"""
+    """Structure for safety warnings (immutable, so cached reports can share them)"""
     severity: str  # "CRITICAL", "WARNING", "INFO"
     category: str  # "contraindication", "interaction", "precaution"
     message: str
     source: str = "Safety Database"
 
 
+# Safety tables are built once at import and shared by every checker
+
+# Herb-condition contraindications
+_CONTRAINDICATIONS: Dict[Tuple[str, str], str] = {
+    ('curcumin', 'blood clotting disorder'): "May increase bleeding risk",
+    ('curcumin', 'gallbladder disease'): "May worsen gallbladder problems",
+    ('ginger', 'bleeding disorder'): "May increase bleeding risk",
+    ('ginger', 'heart condition'): "High doses may affect heart rhythm",
+    ('licorice', 'hypertension'): "May raise blood pressure",
+    ('licorice', 'heart disease'): "May cause fluid retention and worsen heart problems",
+    ('licorice', 'kidney disease'): "May worsen kidney function",
+    ('garlic', 'bleeding disorder'): "May increase bleeding risk",
+    ('ginkgo', 'epilepsy'): "May increase seizure risk",
+    ('ginkgo', 'bleeding disorder'): "May increase bleeding risk",
+    ('st john\'s wort', 'depression'): "May interact with antidepressants",
+    ('st john\'s wort', 'bipolar disorder'): "May trigger mania",
+    ('valerian', 'liver disease'): "May affect liver function",
+    ('echinacea', 'autoimmune disease'): "May stimulate immune system inappropriately",
+    ('ashwagandha', 'hyperthyroidism'): "May increase thyroid hormone levels",
+    ('ashwagandha', 'autoimmune disease'): "May stimulate immune system",
+}
+
+# Herb-drug interactions
+_DRUG_INTERACTIONS: Dict[Tuple[str, str], str] = {
+    ('curcumin', 'warfarin'): "May increase bleeding risk when combined with blood thinners",
+    ('curcumin', 'aspirin'): "May increase bleeding risk",
+    ('ginger', 'warfarin'): "May increase bleeding risk",
+    ('ginger', 'diabetes medication'): "May affect blood sugar levels",
+    ('garlic', 'warfarin'): "May increase bleeding risk significantly",
+    ('garlic', 'saquinavir'): "May reduce effectiveness of HIV medication",
+    ('st john\'s wort', 'ssri'): "May cause serotonin syndrome",
+    ('st john\'s wort', 'birth control pills'): "May reduce effectiveness of contraceptives",
+    ('st john\'s wort', 'immunosuppressants'): "May reduce effectiveness",
+    ('ginkgo', 'blood thinners'): "May increase bleeding risk",
+    ('licorice', 'digoxin'): "May increase risk of irregular heartbeat",
+    ('licorice', 'diuretics'): "May cause low potassium levels",
+    ('valerian', 'sedatives'): "May cause excessive drowsiness",
+    ('valerian', 'anesthesia'): "May enhance sedative effects",
+    ('echinacea', 'immunosuppressants'): "May counteract immunosuppressive effects",
+}
+
+# Herb-herb interactions (keys are unordered herb pairs)
+_HERB_INTERACTIONS: Dict[FrozenSet[str], Dict] = {
+    frozenset({'ginger', 'garlic'}): {
+        'severity': 'WARNING',
+        'effect': 'Combined use may significantly increase bleeding risk'
+    },
+    frozenset({'ginkgo', 'garlic'}): {
+        'severity': 'WARNING',
+        'effect': 'May increase bleeding risk when combined'
+    },
+    frozenset({'st john\'s wort', 'valerian'}): {
+        'severity': 'INFO',
+        'effect': 'May have additive sedative effects'
+    },
+    frozenset({'licorice', 'aloe'}): {
+        'severity': 'WARNING',
+        'effect': 'May cause low potassium levels'
+    },
+}
+
+# Pregnancy safety information
+_PREGNANCY_SAFETY: Dict[str, Dict] = {
+    'curcumin': {'safe': True, 'reason': 'Generally safe in food amounts'},
+    'ginger': {'safe': True, 'reason': 'Safe for morning sickness in moderate amounts'},
+    'licorice': {'safe': False, 'reason': 'May increase risk of preterm labor'},
+    'st john\'s wort': {'safe': False, 'reason': 'Insufficient safety data'},
+    'valerian': {'safe': 'caution', 'reason': 'Limited safety data available'},
+    'echinacea': {'safe': 'caution', 'reason': 'Limited safety data available'},
+    'ashwagandha': {'safe': False, 'reason': 'May cause miscarriage'},
+    'fenugreek': {'safe': 'caution', 'reason': 'May stimulate uterine contractions'},
+}
+
+# Recommended and maximum dosages
+_DOSAGE_LIMITS: Dict[str, Dict] = {
+    'curcumin': {
+        'recommended': '500-2000 mg per day',
+        'maximum': '12g per day (higher doses may cause GI upset)'
+    },
+    'ginger': {
+        'recommended': '1-4g per day',
+        'maximum': '5g per day (higher doses may cause heartburn)'
+    },
+    'garlic': {
+        'recommended': '600-1200 mg per day',
+        'maximum': '7200 mg per day (may cause odor and GI upset)'
+    },
+    'st john\'s wort': {
+        'recommended': '300 mg three times daily',
+        'maximum': '1800 mg per day'
+    },
+    'valerian': {
+        'recommended': '300-600 mg before bedtime',
+        'maximum': '900 mg per day'
+    },
+    'ginkgo': {
+        'recommended': '120-240 mg per day',
+        'maximum': '600 mg per day'
+    },
+}
+
+# Herbs that take part in any herb-herb interaction
+_INTERACTING_HERBS = frozenset(herb for pair in _HERB_INTERACTIONS for herb in pair)
+
+# Every herb with at least one single-herb safety entry, for quick rejects
+_KNOWN_HERBS = frozenset(
+    [herb for herb, _ in _CONTRAINDICATIONS]
+    + [herb for herb, _ in _DRUG_INTERACTIONS]
+    + list(_PREGNANCY_SAFETY)
+    + list(_DOSAGE_LIMITS)
+)
+
+
 class HerbalSafetyChecker:
     """
     Comprehensive safety checking system for herbal remedies
@@ -25,11 +139,13 @@ class HerbalSafetyChecker:
     
     def __init__(self):
         """Initialize safety database"""
-        self.contraindications = self._load_contraindications()
-        self.drug_interactions = self._load_drug_interactions()
-        self.herb_interactions = self._load_herb_interactions()
-        self.pregnancy_safety = self._load_pregnancy_safety()
-        self.dosage_limits = self._load_dosage_limits()
+        self.contraindications = _CONTRAINDICATIONS
+        self.drug_interactions = _DRUG_INTERACTIONS
+        self.herb_interactions = _HERB_INTERACTIONS
+        self.pregnancy_safety = _PREGNANCY_SAFETY
+        self.dosage_limits = _DOSAGE_LIMITS
+        self._interacting_herbs = _INTERACTING_HERBS
+        self._known_herbs = _KNOWN_HERBS
     
     def check_herb_safety(
         self, 
@@ -37,7 +153,9 @@ class HerbalSafetyChecker:
         patient_conditions: List[str] = None,
         current_medications: List[str] = None,
         is_pregnant: bool = False,
-        is_breastfeeding: bool = False
+        is_breastfeeding: bool = False,
+        conditions_lower: List[str] = None,
+        medications_lower: List[str] = None
     ) -> List[SafetyWarning]:
         """
         Comprehensive safety check for a single herb
@@ -48,6 +166,8 @@ class HerbalSafetyChecker:
             current_medications: List of medications patient is taking
             is_pregnant: Whether patient is pregnant
             is_breastfeeding: Whether patient is breastfeeding
+            conditions_lower: Optional pre-lowercased patient_conditions (same order)
+            medications_lower: Optional pre-lowercased current_medications (same order)
             
         Returns:
             List of SafetyWarning objects
@@ -55,10 +175,15 @@ class HerbalSafetyChecker:
         warnings = []
         herb_lower = herb_name.lower()
         
+        # Herbs absent from every table cannot produce a warning
+        if herb_lower not in self._known_herbs:
+            return warnings
+        
         # Check contraindications
         if patient_conditions:
-            for condition in patient_conditions:
-                condition_lower = condition.lower()
+            if conditions_lower is None:
+                conditions_lower = [c.lower() for c in patient_conditions]
+            for condition, condition_lower in zip(patient_conditions, conditions_lower):
                 if (herb_lower, condition_lower) in self.contraindications:
                     warnings.append(SafetyWarning(
                         severity="WARNING",
@@ -68,8 +193,9 @@ class HerbalSafetyChecker:
         
         # Check drug interactions
         if current_medications:
-            for medication in current_medications:
-                med_lower = medication.lower()
+            if medications_lower is None:
+                medications_lower = [m.lower() for m in current_medications]
+            for medication, med_lower in zip(current_medications, medications_lower):
                 if (herb_lower, med_lower) in self.drug_interactions:
                     warnings.append(SafetyWarning(
                         severity="CRITICAL",
@@ -119,22 +245,15 @@ class HerbalSafetyChecker:
         """
         warnings = []
         
-        # Check all pairs
-        for i, herb1 in enumerate(herbs):
-            for herb2 in herbs[i+1:]:
-                herb1_lower = herb1.lower()
-                herb2_lower = herb2.lower()
-                
-                # Check both orderings
-                if (herb1_lower, herb2_lower) in self.herb_interactions:
-                    interaction = self.herb_interactions[(herb1_lower, herb2_lower)]
-                    warnings.append(SafetyWarning(
-                        severity=interaction['severity'],
-                        category="herb_interaction",
-                        message=f"⚠️  {herb1} + {herb2}: {interaction['effect']}"
-                    ))
-                elif (herb2_lower, herb1_lower) in self.herb_interactions:
-                    interaction = self.herb_interactions[(herb2_lower, herb1_lower)]
+        # Only herbs with a known interaction can form a flagged pair
+        candidates = [herb for herb in herbs if herb.lower() in self._interacting_herbs]
+        
+        # Check all candidate pairs
+        for i, herb1 in enumerate(candidates):
+            for herb2 in candidates[i+1:]:
+                # Keys are order-independent, so one probe covers both orderings
+                interaction = self.herb_interactions.get(frozenset((herb1.lower(), herb2.lower())))
+                if interaction is not None:
                     warnings.append(SafetyWarning(
                         severity=interaction['severity'],
                         category="herb_interaction",
@@ -157,13 +276,38 @@ class HerbalSafetyChecker:
         Returns:
             Dict with warnings categorized by severity and type
         """
+        report = _cached_safety_report(
+            tuple(herbs),
+            tuple(patient_conditions or ()),
+            tuple(current_medications or ()),
+            bool(is_pregnant),
+            bool(is_breastfeeding)
+        )
+        # Fresh containers so callers can't mutate the cached report
+        return {key: list(value) if isinstance(value, list) else value for key, value in report.items()}
+    
+    def _build_safety_report(
+        self,
+        herbs: Tuple[str, ...],
+        patient_conditions: Tuple[str, ...],
+        current_medications: Tuple[str, ...],
+        is_pregnant: bool,
+        is_breastfeeding: bool
+    ) -> Dict:
+        """Uncached body of get_comprehensive_safety_report (hashable tuple inputs)"""
         all_warnings = []
         
+        # Lowercase patient data once instead of once per herb
+        conditions_lower = [c.lower() for c in (patient_conditions or [])]
+        medications_lower = [m.lower() for m in (current_medications or [])]
+        
         # Check each herb individually
         for herb in herbs:
             herb_warnings = self.check_herb_safety(
                 herb, patient_conditions, current_medications, 
-                is_pregnant, is_breastfeeding
+                is_pregnant, is_breastfeeding,
+                conditions_lower=conditions_lower,
+                medications_lower=medications_lower
             )
             all_warnings.extend(herb_warnings)
         
@@ -196,110 +340,22 @@ class HerbalSafetyChecker:
             return f"✅ Generally safe. {len(info)} informational notes provided."
         else:
             return "✅ No safety concerns identified. Still recommend consulting healthcare provider."
-    
-    def _load_contraindications(self) -> Dict[Tuple[str, str], str]:
-        """Load herb-condition contraindications database"""
-        return {
-            ('curcumin', 'blood clotting disorder'): "May increase bleeding risk",
-            ('curcumin', 'gallbladder disease'): "May worsen gallbladder problems",
-            ('ginger', 'bleeding disorder'): "May increase bleeding risk",
-            ('ginger', 'heart condition'): "High doses may affect heart rhythm",
-            ('licorice', 'hypertension'): "May raise blood pressure",
-            ('licorice', 'heart disease'): "May cause fluid retention and worsen heart problems",
-            ('licorice', 'kidney disease'): "May worsen kidney function",
-            ('garlic', 'bleeding disorder'): "May increase bleeding risk",
-            ('ginkgo', 'epilepsy'): "May increase seizure risk",
-            ('ginkgo', 'bleeding disorder'): "May increase bleeding risk",
-            ('st john\'s wort', 'depression'): "May interact with antidepressants",
-            ('st john\'s wort', 'bipolar disorder'): "May trigger mania",
-            ('valerian', 'liver disease'): "May affect liver function",
-            ('echinacea', 'autoimmune disease'): "May stimulate immune system inappropriately",
-            ('ashwagandha', 'hyperthyroidism'): "May increase thyroid hormone levels",
-            ('ashwagandha', 'autoimmune disease'): "May stimulate immune system",
-        }
-    
-    def _load_drug_interactions(self) -> Dict[Tuple[str, str], str]:
-        """Load herb-drug interactions database"""
-        return {
-            ('curcumin', 'warfarin'): "May increase bleeding risk when combined with blood thinners",
-            ('curcumin', 'aspirin'): "May increase bleeding risk",
-            ('ginger', 'warfarin'): "May increase bleeding risk",
-            ('ginger', 'diabetes medication'): "May affect blood sugar levels",
-            ('garlic', 'warfarin'): "May increase bleeding risk significantly",
-            ('garlic', 'saquinavir'): "May reduce effectiveness of HIV medication",
-            ('st john\'s wort', 'ssri'): "May cause serotonin syndrome",
-            ('st john\'s wort', 'birth control pills'): "May reduce effectiveness of contraceptives",
-            ('st john\'s wort', 'immunosuppressants'): "May reduce effectiveness",
-            ('ginkgo', 'blood thinners'): "May increase bleeding risk",
-            ('licorice', 'digoxin'): "May increase risk of irregular heartbeat",
-            ('licorice', 'diuretics'): "May cause low potassium levels",
-            ('valerian', 'sedatives'): "May cause excessive drowsiness",
-            ('valerian', 'anesthesia'): "May enhance sedative effects",
-            ('echinacea', 'immunosuppressants'): "May counteract immunosuppressive effects",
-        }
-    
-    def _load_herb_interactions(self) -> Dict[Tuple[str, str], Dict]:
-        """Load herb-herb interactions database"""
-        return {
-            ('ginger', 'garlic'): {
-                'severity': 'WARNING',
-                'effect': 'Combined use may significantly increase bleeding risk'
-            },
-            ('ginkgo', 'garlic'): {
-                'severity': 'WARNING',
-                'effect': 'May increase bleeding risk when combined'
-            },
-            ('st john\'s wort', 'valerian'): {
-                'severity': 'INFO',
-                'effect': 'May have additive sedative effects'
-            },
-            ('licorice', 'aloe'): {
-                'severity': 'WARNING',
-                'effect': 'May cause low potassium levels'
-            },
-        }
-    
-    def _load_pregnancy_safety(self) -> Dict[str, Dict]:
-        """Load pregnancy safety information"""
-        return {
-            'curcumin': {'safe': True, 'reason': 'Generally safe in food amounts'},
-            'ginger': {'safe': True, 'reason': 'Safe for morning sickness in moderate amounts'},
-            'licorice': {'safe': False, 'reason': 'May increase risk of preterm labor'},
-            'st john\'s wort': {'safe': False, 'reason': 'Insufficient safety data'},
-            'valerian': {'safe': 'caution', 'reason': 'Limited safety data available'},
-            'echinacea': {'safe': 'caution', 'reason': 'Limited safety data available'},
-            'ashwagandha': {'safe': False, 'reason': 'May cause miscarriage'},
-            'fenugreek': {'safe': 'caution', 'reason': 'May stimulate uterine contractions'},
-        }
-    
-    def _load_dosage_limits(self) -> Dict[str, Dict]:
-        """Load recommended and maximum dosages"""
-        return {
-            'curcumin': {
-                'recommended': '500-2000 mg per day',
-                'maximum': '12g per day (higher doses may cause GI upset)'
-            },
-            'ginger': {
-                'recommended': '1-4g per day',
-                'maximum': '5g per day (higher doses may cause heartburn)'
-            },
-            'garlic': {
-                'recommended': '600-1200 mg per day',
-                'maximum': '7200 mg per day (may cause odor and GI upset)'
-            },
-            'st john\'s wort': {
-                'recommended': '300 mg three times daily',
-                'maximum': '1800 mg per day'
-            },
-            'valerian': {
-                'recommended': '300-600 mg before bedtime',
-                'maximum': '900 mg per day'
-            },
-            'ginkgo': {
-                'recommended': '120-240 mg per day',
-                'maximum': '600 mg per day'
-            },
-        }
+
+
+# Reports are pure functions of their inputs and the shared safety tables, so
+# one module-level cache serves every checker
+@lru_cache(maxsize=256)
+def _cached_safety_report(
+    herbs: Tuple[str, ...],
+    patient_conditions: Tuple[str, ...],
+    current_medications: Tuple[str, ...],
+    is_pregnant: bool,
+    is_breastfeeding: bool
+) -> Dict:
+    """Memoized HerbalSafetyChecker._build_safety_report (hashable tuple inputs)"""
+    return HerbalSafetyChecker()._build_safety_report(
+        herbs, patient_conditions, current_medications, is_pregnant, is_breastfeeding
+    )
 
 
 # Example usage and testing
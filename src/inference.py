@@ -7,23 +7,26 @@ from sklearn.ensemble import RandomForestClassifier
 # -----------------------------
 # Load models and embeddings
 # -----------------------------
-emb = KeyedVectors.load("data/embeddings.kv")
+# Memory-mapped: vectors stored as a .npy sidecar are paged in on demand
+emb = KeyedVectors.load("data/embeddings.kv", mmap="r")
 model = joblib.load("data/shap_rf.pkl")
 
+# Lower-cased vocabulary aligned with emb.vectors rows, for vectorized masking
+KEYS_LOWER = np.array([w.lower() for w in emb.index_to_key], dtype=object)
+
 # Basic disease vocabulary (you can expand this!)
 DISEASE_KEYWORDS = [
     "fever", "inflammation", "pain", "infection", "cold", "cough",
     "headache", "diabetes", "ulcer", "hypertension", "asthma"
 ]
 
+# All keywords in one compiled alternation: a single scan of the input
+_KEYWORD_RE = re.compile(r"\b(" + "|".join(map(re.escape, DISEASE_KEYWORDS)) + r")\b")
+
 def extract_disease_keywords(user_input):
     """Extract disease-like words from long sentences."""
-    text = user_input.lower()
-    found = []
-    for keyword in DISEASE_KEYWORDS:
-        if re.search(rf"\b{keyword}\b", text):
-            found.append(keyword)
-    return found
+    hits = set(_KEYWORD_RE.findall(user_input.lower()))
+    return [keyword for keyword in DISEASE_KEYWORDS if keyword in hits]
 
 def recommend_ingredients(disease_name, top_n=5):
     """Get top natural ingredients for a given disease."""
@@ -31,15 +34,21 @@ def recommend_ingredients(disease_name, top_n=5):
         print(f"⚠️ '{disease_name}' not found in embeddings.")
         return []
 
-    candidates = [w for w in emb.key_to_index if not w.lower() == disease_name]
-    scores = []
-    for c in candidates:
-        if c in emb.key_to_index:
-            x = np.multiply(emb[c], emb[disease_name]).reshape(1, -1)
-            prob = model.predict_proba(x)[0][1]
-            scores.append((c, prob))
-    scores.sort(key=lambda x: x[1], reverse=True)
-    return scores[:top_n]
+    # Score every candidate in one batch: (V, D) elementwise products -> one predict_proba
+    keep = KEYS_LOWER != disease_name
+    candidates = np.asarray(emb.index_to_key, dtype=object)[keep]
+    X = emb.vectors[keep] * emb[disease_name]
+    probs = model.predict_proba(X)[:, 1]
+
+    if 0 < top_n < len(probs):
+        # O(V) top-k: partition out the k-th best score, keep everything tied
+        # with it, then sort that small set (ties broken by vocabulary order)
+        kth = probs[np.argpartition(-probs, top_n - 1)[top_n - 1]]
+        idx = np.flatnonzero(probs >= kth)
+        order = idx[np.lexsort((idx, -probs[idx]))][:top_n]
+    else:
+        order = np.argsort(-probs, kind="stable")[:top_n]
+    return [(candidates[i], float(probs[i])) for i in order]
 
 # -----------------------------
 # MAIN
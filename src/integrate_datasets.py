@@ -12,6 +12,45 @@ from sklearn.preprocessing import StandardScaler
 import joblib
 import os
 
+HAS_PYARROW = False
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Files above this size are streamed in chunks instead of loaded whole
+CHUNK_THRESHOLD_BYTES = 64 * 1024 * 1024
+CHUNK_ROWS = 100_000
+
+
+def read_csv_fast(path, chunksize=None):
+    """Read a CSV with the pyarrow engine when available, else the C engine.
+
+    Passing ``chunksize`` returns an iterator of DataFrames (C engine only,
+    since pyarrow does not support chunked reads).
+    """
+    if chunksize is not None:
+        return pd.read_csv(path, engine="c", chunksize=chunksize)
+    if HAS_PYARROW:
+        return pd.read_csv(path, engine="pyarrow")
+    return pd.read_csv(path, engine="c", low_memory=False, cache_dates=True)
+
+
+def _rule_pairs(rules, diseases) -> pd.DataFrame:
+    """Build symptom-disease pairs from (symptom, row mask) rules.
+
+    Pairs come out row by row, in rule order within a row.
+    """
+    masks = np.column_stack([np.asarray(mask, dtype=bool) for _, mask in rules])
+    rows, cols = np.nonzero(masks)
+    symptoms = np.array([symptom for symptom, _ in rules], dtype=object)
+    return pd.DataFrame({
+        'symptom': symptoms[cols],
+        'disease': np.asarray(diseases, dtype=object)[rows],
+    })
+
+
 class DatasetIntegrator:
     """Integrate multiple Kaggle datasets into the system"""
     
@@ -40,19 +79,16 @@ class DatasetIntegrator:
         ]
         
         # Create symptom-disease pairs
-        pairs = []
-        for idx, row in df.iterrows():
-            disease = disease_mapping.get(row.iloc[-1], "Diabetes")
-            
-            # Create features-based symptoms
-            if row['Glucose'] > 126:
-                pairs.append(("High blood sugar", disease))
-            if row['BMI'] > 30:
-                pairs.append(("Weight-related issues", disease))
-            if row['Age'] > 40:
-                pairs.append(("Age-related risk", disease))
-        
-        return pd.DataFrame(pairs, columns=['symptom', 'disease']), {
+        diseases = df.iloc[:, -1].map(disease_mapping).fillna("Diabetes")
+        
+        # Create features-based symptoms
+        pairs = _rule_pairs([
+            ("High blood sugar", df['Glucose'] > 126),
+            ("Weight-related issues", df['BMI'] > 30),
+            ("Age-related risk", df['Age'] > 40),
+        ], diseases)
+        
+        return pairs, {
             "n_samples": len(df),
             "n_features": len(df.columns) - 1,
             "diseases": list(set(disease_mapping.values()))
@@ -77,20 +113,16 @@ class DatasetIntegrator:
         }
         
         # Create symptom pairs
-        pairs = []
         target_col = df.columns[-1]
+        diseases = df[target_col].astype(int).map(disease_mapping).fillna("Heart Disease")
         
-        for idx, row in df.iterrows():
-            disease = disease_mapping.get(int(row[target_col]), "Heart Disease")
-            
-            if row['cp'] > 0:  # Chest pain type
-                pairs.append(("Chest pain", disease))
-            if row['trestbps'] > 140:  # Resting blood pressure
-                pairs.append(("High blood pressure", disease))
-            if row['chol'] > 240:  # Cholesterol
-                pairs.append(("High cholesterol", disease))
-        
-        return pd.DataFrame(pairs, columns=['symptom', 'disease']), {
+        pairs = _rule_pairs([
+            ("Chest pain", df['cp'] > 0),  # Chest pain type
+            ("High blood pressure", df['trestbps'] > 140),  # Resting blood pressure
+            ("High cholesterol", df['chol'] > 240),  # Cholesterol
+        ], diseases)
+        
+        return pairs, {
             "n_samples": len(df),
             "n_features": len(df.columns) - 1,
             "diseases": list(set(disease_mapping.values()))
@@ -109,26 +141,29 @@ class DatasetIntegrator:
             "Chest pain during breathing"
         ]
         
-        pairs = []
+        no_rows = np.zeros(len(df), dtype=bool)
         
-        for idx, row in df.iterrows():
-            disease = "Asthma"
-            
-            if 'Lung_function' in row and row['Lung_function'] < 70:
-                pairs.append(("Shortness of breath", disease))
-            if 'Smoking_status' in row and row['Smoking_status'] > 0:
-                pairs.append(("Persistent cough", disease))
-            if 'Air_pollution' in row and row['Air_pollution'] > 5:
-                pairs.append(("Pollution-related symptoms", disease))
-        
-        return pd.DataFrame(pairs, columns=['symptom', 'disease']), {
+        def column_mask(column, test):
+            return test(df[column]) if column in df.columns else no_rows
+        
+        pairs = _rule_pairs([
+            ("Shortness of breath", column_mask('Lung_function', lambda c: c < 70)),
+            ("Persistent cough", column_mask('Smoking_status', lambda c: c > 0)),
+            ("Pollution-related symptoms", column_mask('Air_pollution', lambda c: c > 5)),
+        ], np.full(len(df), "Asthma", dtype=object))
+        
+        return pairs, {
             "n_samples": len(df),
             "n_features": len(df.columns),
             "diseases": ["Asthma", "Respiratory Disease"]
         }
     
-    def integrate_all_datasets(self):
-        """Integrate all downloaded datasets"""
+    def integrate_all_datasets(self, write_csv: bool = False):
+        """Integrate all downloaded datasets
+
+        The result is saved as zstd-compressed Parquet when pyarrow is
+        installed; ``write_csv=True`` also writes a CSV copy for debugging.
+        """
         
         print("""
 ╔════════════════════════════════════════════════════════════════╗
@@ -136,7 +171,7 @@ class DatasetIntegrator:
 ╚════════════════════════════════════════════════════════════════╝
         """)
         
-        dataset_files = list(self.data_dir.glob("*//*.csv")) + list(self.data_dir.glob("*.csv"))
+        dataset_files = sorted(self.data_dir.rglob("*.csv"))
         
         if not dataset_files:
             print("⚠️  No datasets found in", self.data_dir)
@@ -149,25 +184,33 @@ class DatasetIntegrator:
             print(f"\n📊 Processing {dataset_file.name}...")
             
             try:
-                df = pd.read_csv(dataset_file)
-                
                 # Process based on filename
                 filename = dataset_file.stem.lower()
                 
                 if 'diabetes' in filename:
-                    symptoms_df, stats = self.process_diabetes_dataset(df)
+                    process = self.process_diabetes_dataset
                 elif 'heart' in filename:
-                    symptoms_df, stats = self.process_heart_disease_dataset(df)
+                    process = self.process_heart_disease_dataset
                 elif 'asthma' in filename or 'respiratory' in filename:
-                    symptoms_df, stats = self.process_asthma_dataset(df)
+                    process = self.process_asthma_dataset
                 else:
                     print(f"   ⚠️  Unknown dataset format, skipping")
                     continue
                 
-                all_symptoms.extend(symptoms_df.values.tolist())
+                # Large files are processed chunk by chunk to cap peak memory
+                if dataset_file.stat().st_size > CHUNK_THRESHOLD_BYTES:
+                    chunks = read_csv_fast(dataset_file, chunksize=CHUNK_ROWS)
+                else:
+                    chunks = [read_csv_fast(dataset_file)]
+                
+                n_pairs = 0
+                for df in chunks:
+                    symptoms_df, stats = process(df)
+                    all_symptoms.extend(symptoms_df.values.tolist())
+                    n_pairs += len(symptoms_df)
                 all_diseases.update(stats['diseases'])
                 
-                print(f"   ✅ Processed {len(symptoms_df)} symptom-disease pairs")
+                print(f"   ✅ Processed {n_pairs} symptom-disease pairs")
                 print(f"   📌 Diseases: {', '.join(stats['diseases'])}")
             
             except Exception as e:
@@ -176,8 +219,15 @@ class DatasetIntegrator:
         if all_symptoms:
             # Save integrated dataset
             integrated_df = pd.DataFrame(all_symptoms, columns=['symptom', 'disease'])
-            output_file = self.output_dir / "integrated_symptoms.csv"
-            integrated_df.to_csv(output_file, index=False)
+            csv_file = self.output_dir / "integrated_symptoms.csv"
+            if HAS_PYARROW:
+                output_file = self.output_dir / "integrated_symptoms.parquet"
+                integrated_df.to_parquet(output_file, compression="zstd", index=False)
+                if write_csv:
+                    integrated_df.to_csv(csv_file, index=False)
+            else:
+                output_file = csv_file
+                integrated_df.to_csv(output_file, index=False)
             
             print(f"\n✅ Integrated Dataset Summary")
             print(f"   Total symptom-disease pairs: {len(integrated_df)}")
@@ -19,6 +19,9 @@ from typing import Dict, List, Optional
 import sqlite3
 import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # Setup logging
 logging.basicConfig(
@@ -36,6 +39,153 @@ except ImportError:
     print("❌ Failed to import DatabaseManager. Ensure database_manager.py is in the src folder.")
     sys.exit(1)
 
+HAS_PYARROW = False
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+HAS_ORJSON = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _to_json(obj) -> str:
+    """Serialize a detail record, with orjson when available (stored as TEXT)"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _string_records_to_json(fields: pd.DataFrame) -> List[str]:
+    """One JSON object per row of an all-string frame, via column-wise concatenation.
+    
+    Values only need their backslashes and quotes escaped; frames holding
+    control characters (which need \\uXXXX escapes) go through _to_json.
+    """
+    if fields.empty:
+        return []
+    if fields.apply(lambda col: col.str.contains(r'[\x00-\x1f]').any()).any():
+        return list(map(_to_json, fields.to_dict(orient='records')))
+    
+    json_col = None
+    for column in fields.columns:
+        value = fields[column].str.replace('\\', '\\\\', regex=False).str.replace('"', '\\"', regex=False)
+        if json_col is None:
+            json_col = '{"' + column + '":"' + value
+        else:
+            json_col = json_col + '","' + column + '":"' + value
+    return (json_col + '"}').tolist()
+
+
+# Expected text columns of each dataset, with the value used when a column
+# or cell is missing (each plant dataset's display name defaults per row)
+MEDICINAL_PLANT_DEFAULTS = {
+    'scientific_name': '',
+    'active_compounds': 'Unknown',
+    'medicinal_properties': 'Unknown',
+    'traditional_uses': 'Unknown',
+    'dosage': 'Consult herbalist',
+    'side_effects': 'None known',
+    'contraindications': 'None known',
+}
+INDIAN_PLANT_DEFAULTS = {
+    'scientific_name': '',
+    'ayurvedic_properties': 'Unknown',
+    'rasa': 'Unknown',
+    'veerya': 'Unknown',
+    'vipaka': 'Unknown',
+    'plant_part_used': 'Whole plant',
+    'traditional_uses': 'Unknown',
+    'dosage_form': 'Powder/Decoction',
+}
+RECOMMENDATION_DEFAULTS = {
+    'symptoms': 'Unknown',
+    'recommended_medicine': 'Unknown',
+    'gender': 'Any',
+    'kidney_function': 'Normal',
+    'liver_function': 'Normal',
+}
+
+# Columns the drug reviews integration actually reads
+DRUG_REVIEW_COLUMNS = ['drug_name', 'rating', 'effectiveness', 'condition']
+# Rows per chunk when streaming review files (caps peak memory)
+DRUG_REVIEW_CHUNK_ROWS = 500_000
+# A non-empty, whitespace-trimmed item of a comma-separated symptom list
+SYMPTOM_TOKEN = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+
+def _parse_csv(csv_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Parse a CSV with the multithreaded pyarrow engine, else the C engine"""
+    if HAS_PYARROW:
+        try:
+            return pd.read_csv(csv_file, engine='pyarrow', usecols=usecols)
+        except ValueError as e:  # pyarrow.ArrowInvalid, e.g. quoting edge cases
+            logger.warning(f"pyarrow could not parse {csv_file.name} ({e}); using the C engine")
+    return pd.read_csv(csv_file, usecols=usecols)
+
+
+def _read_csv(csv_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load a dataset CSV through a sibling .parquet cache.
+    
+    The cache is reused while it is at least as new as the CSV; otherwise the
+    CSV is parsed and the cache rewritten (zstd). Without pyarrow the CSV is
+    always parsed.
+    """
+    if not HAS_PYARROW:
+        return _parse_csv(csv_file, usecols)
+    
+    cache_file = csv_file.with_suffix('.parquet')
+    if cache_file.exists() and cache_file.stat().st_mtime >= csv_file.stat().st_mtime:
+        return pd.read_parquet(cache_file, columns=usecols)
+    
+    df = _parse_csv(csv_file)
+    try:
+        df.to_parquet(cache_file, compression='zstd')
+    except (ValueError, TypeError, OSError) as e:  # e.g. mixed-type object columns
+        logger.warning(f"Could not cache {csv_file.name} as parquet: {e}")
+    return df if usecols is None else df[usecols]
+
+
+def _modes(counts: pd.Series, column: str) -> pd.Series:
+    """Most frequent ``column`` value per drug from (drug_name, value) counts.
+    
+    Ties go to the smallest value, as with Series.mode()[0].
+    """
+    if counts.empty:
+        return pd.Series(dtype=object)
+    counts = counts.rename_axis(['drug_name', column]).reset_index(name='n')
+    ranked = counts.sort_values(['drug_name', 'n', column], ascending=[True, False, True])
+    return ranked.drop_duplicates('drug_name').set_index('drug_name')[column]
+
+
+def _row_numbers(df: pd.DataFrame) -> pd.Index:
+    """Row number of each row within its own CSV file, as strings"""
+    return df.index.get_level_values(-1).astype(str)
+
+
+def _plant_names(df: pd.DataFrame) -> pd.Series:
+    """Plant names from 'plant_name', else 'name', else Plant_<row>, row by row.
+    
+    Rows of files with different schemas can be stacked together, so the
+    choice is made per row rather than per column.
+    """
+    names = pd.Series(None, index=df.index, dtype=object)
+    for column in ('plant_name', 'name'):
+        if column in df.columns:
+            names = names.fillna(df[column].astype(object))
+    fallback = pd.Series('Plant_' + _row_numbers(df), index=df.index)
+    return names.fillna(fallback).astype(str)
+
+
+def _text_columns(df: pd.DataFrame, defaults: Dict) -> pd.DataFrame:
+    """Select the columns in ``defaults`` as strings, filling missing columns/values"""
+    return df.reindex(columns=list(defaults)).fillna(defaults).astype(str)
+
 
 class MedicinalDatasetIntegrator:
     """Integrate medicinal datasets into the medical knowledge database"""
@@ -44,6 +194,20 @@ class MedicinalDatasetIntegrator:
         self.data_dir = Path(data_dir)
         self.kaggle_datasets_dir = Path(data_dir) / "kaggle_datasets"
         self.db = DatabaseManager()
+        
+        # Bulk-load friendly, connection-local settings. The journal mode is
+        # left alone: it is persistent and shared with the running app.
+        self.db.connection.execute("PRAGMA synchronous=NORMAL")
+        self.db.connection.execute("PRAGMA temp_store=MEMORY")
+        # ~200 MB page cache (negative = KiB) for the duration of the batch
+        self.db.connection.execute("PRAGMA cache_size=-200000")
+        
+        # One cursor reused for every batched statement
+        self.cursor = self.db.connection.cursor()
+        
+        # Dataset CSVs keyed by subdirectory, listed with a single directory walk
+        self._csvs = self._scan_datasets()
+        
         self.stats = {
             "medicinal_plants_added": 0,
             "indian_plants_added": 0,
@@ -52,6 +216,67 @@ class MedicinalDatasetIntegrator:
             "errors": []
         }
     
+    def _scan_datasets(self) -> Dict[str, List[Path]]:
+        """Map each dataset subdirectory of kaggle_datasets to its CSV files"""
+        csvs = {}
+        if not self.kaggle_datasets_dir.is_dir():
+            return csvs
+        with os.scandir(self.kaggle_datasets_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as files:
+                        csvs[entry.name] = sorted(
+                            Path(f.path) for f in files
+                            if f.name.endswith('.csv') and f.is_file()
+                        )
+        return csvs
+    
+    def _read_csvs(self, csv_files: List[Path], usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Parse a dataset's CSV files on a thread pool and stack them.
+        
+        Rows are indexed by (file number, row within the file), so per-file
+        row numbers survive the concatenation (see _row_numbers).
+        """
+        workers = min(len(csv_files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = list(executor.map(partial(_read_csv, usecols=usecols), csv_files))
+        return pd.concat(frames, keys=range(len(frames)))
+    
+    def _aggregate_drug_reviews(self, csv_files: List[Path]) -> pd.DataFrame:
+        """Per-drug mean rating, review count and modal effectiveness/condition.
+        
+        Files are read in chunks; sums, counts and value counters are merged
+        across chunks, so peak memory is bounded by the chunk size.
+        """
+        rating_sum = pd.Series(dtype=float)
+        rating_count = pd.Series(dtype=float)
+        partial_counts = {'effectiveness': [], 'condition': []}
+        
+        for csv_file in csv_files:
+            print(f"\n📄 Processing: {csv_file.name}")
+            for chunk in pd.read_csv(csv_file, usecols=DRUG_REVIEW_COLUMNS,
+                                     chunksize=DRUG_REVIEW_CHUNK_ROWS):
+                ratings = chunk.groupby('drug_name')['rating'].agg(['sum', 'count'])
+                rating_sum = rating_sum.add(ratings['sum'], fill_value=0)
+                rating_count = rating_count.add(ratings['count'], fill_value=0)
+                for column, parts in partial_counts.items():
+                    parts.append(chunk.groupby(['drug_name', column]).size())
+        
+        # Merge per-chunk (drug_name, value) counts, then take each drug's mode
+        modes = {
+            column: _modes(pd.concat(parts).groupby(level=[0, 1]).sum(), column)
+            for column, parts in partial_counts.items()
+        }
+        
+        drugs = rating_count.index.sort_values()
+        return pd.DataFrame({
+            'drug_name': drugs,
+            'rating_mean': (rating_sum / rating_count.where(rating_count > 0))[drugs].values,
+            'rating_count': rating_count[drugs].values,
+            'effectiveness': modes['effectiveness'].reindex(drugs).fillna('Not specified').values,
+            'condition': modes['condition'].reindex(drugs).fillna('Unknown').values,
+        })
+    
     def integrate_medicinal_plants(self) -> bool:
         """Integrate medicinal plants dataset"""
         print("\n📌 INTEGRATING MEDICINAL PLANTS DATASET")
@@ -60,7 +285,7 @@ class MedicinalDatasetIntegrator:
         dataset_path = self.kaggle_datasets_dir / "medicinal_plants"
         
         # Find CSV files in the dataset
-        csv_files = list(dataset_path.glob("*.csv")) if dataset_path.exists() else []
+        csv_files = self._csvs.get("medicinal_plants", [])
         
         if not csv_files:
             print(f"⚠️  No CSV files found in {dataset_path}")
@@ -69,57 +294,33 @@ class MedicinalDatasetIntegrator:
             return False
         
         try:
-            for csv_file in csv_files:
-                print(f"\n📄 Processing: {csv_file.name}")
-                df = pd.read_csv(csv_file)
+            # One transaction per dataset: rolled back as a whole on error,
+            # committed (and synced to disk) once at the end
+            with self.db.connection:
+                print(f"\n📄 Processing: {', '.join(f.name for f in csv_files)}")
+                # Parse all files in parallel (read_csv releases the GIL); SQLite
+                # writes stay on this thread
+                df = self._read_csvs(csv_files)
+                
+                # Coerce every field once at the DataFrame level instead of per row
+                plant_name = _plant_names(df)
+                fields = _text_columns(df, {'common_name': plant_name, **MEDICINAL_PLANT_DEFAULTS})
+                
+                # Detailed information is stored as JSON in the herb's properties
+                details = _string_records_to_json(fields)
+                
+                self.cursor.executemany("""
+                    INSERT INTO herbs
+                    (name, scientific_name, properties, effectiveness_rating)
+                    VALUES (?, ?, ?, 0.75)
+                    ON CONFLICT(name) DO UPDATE SET
+                        scientific_name = excluded.scientific_name,
+                        properties = excluded.properties
+                """, zip(plant_name.tolist(), fields['scientific_name'].tolist(), details))
                 
-                # Add medicinal plants to database
-                for idx, row in df.iterrows():
-                    try:
-                        plant_name = str(row.get('plant_name', row.get('name', f'Plant_{idx}')))
-                        common_name = str(row.get('common_name', plant_name))
-                        scientific_name = str(row.get('scientific_name', ''))
-                        active_compounds = str(row.get('active_compounds', 'Unknown'))
-                        medicinal_properties = str(row.get('medicinal_properties', 'Unknown'))
-                        traditional_uses = str(row.get('traditional_uses', 'Unknown'))
-                        
-                        # Add herb to database if not exists
-                        try:
-                            herb_id = self.db.add_herb(
-                                name=plant_name,
-                                description=f"{common_name} ({scientific_name})",
-                                effectiveness_rating=0.75  # Default rating
-                            )
-                            
-                            # Store detailed information
-                            details = {
-                                "common_name": common_name,
-                                "scientific_name": scientific_name,
-                                "active_compounds": active_compounds,
-                                "medicinal_properties": medicinal_properties,
-                                "traditional_uses": traditional_uses,
-                                "dosage": str(row.get('dosage', 'Consult herbalist')),
-                                "side_effects": str(row.get('side_effects', 'None known')),
-                                "contraindications": str(row.get('contraindications', 'None known'))
-                            }
-                            
-                            # Store in database using custom query
-                            self.db.conn.execute("""
-                                UPDATE herbs 
-                                SET description = ?
-                                WHERE id = ?
-                            """, (json.dumps(details), herb_id))
-                            
-                            self.stats["medicinal_plants_added"] += 1
-                        except Exception as e:
-                            logger.debug(f"Herb already exists: {plant_name}")
-                            self.stats["medicinal_plants_added"] += 1
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing plant row {idx}: {e}")
-                        self.stats["errors"].append(f"Medicinal plants - Row {idx}: {str(e)}")
+                # Rows inserted or updated by the batch, as reported by SQLite
+                self.stats["medicinal_plants_added"] += self.cursor.rowcount
             
-            self.db.conn.commit()
             print(f"\n✅ Added {self.stats['medicinal_plants_added']} medicinal plants")
             return True
         
@@ -135,7 +336,7 @@ class MedicinalDatasetIntegrator:
         
         dataset_path = self.kaggle_datasets_dir / "indian_medicinal_plants"
         
-        csv_files = list(dataset_path.glob("*.csv")) if dataset_path.exists() else []
+        csv_files = self._csvs.get("indian_medicinal_plants", [])
         
         if not csv_files:
             print(f"⚠️  No CSV files found in {dataset_path}")
@@ -143,55 +344,33 @@ class MedicinalDatasetIntegrator:
             return False
         
         try:
-            for csv_file in csv_files:
-                print(f"\n📄 Processing: {csv_file.name}")
-                df = pd.read_csv(csv_file)
+            # One transaction per dataset: rolled back as a whole on error,
+            # committed (and synced to disk) once at the end
+            with self.db.connection:
+                print(f"\n📄 Processing: {', '.join(f.name for f in csv_files)}")
+                # Parse all files in parallel (read_csv releases the GIL); SQLite
+                # writes stay on this thread
+                df = self._read_csvs(csv_files)
                 
-                for idx, row in df.iterrows():
-                    try:
-                        plant_name = str(row.get('plant_name', row.get('name', f'Plant_{idx}')))
-                        english_name = str(row.get('english_name', plant_name))
-                        scientific_name = str(row.get('scientific_name', ''))
-                        ayurvedic_props = str(row.get('ayurvedic_properties', 'Unknown'))
-                        uses = str(row.get('traditional_uses', 'Unknown'))
-                        
-                        try:
-                            herb_id = self.db.add_herb(
-                                name=plant_name,
-                                description=f"Ayurveda | {english_name} ({scientific_name})",
-                                effectiveness_rating=0.80
-                            )
-                            
-                            # Store Ayurvedic details
-                            details = {
-                                "english_name": english_name,
-                                "scientific_name": scientific_name,
-                                "ayurvedic_properties": ayurvedic_props,
-                                "rasa": str(row.get('rasa', 'Unknown')),
-                                "veerya": str(row.get('veerya', 'Unknown')),
-                                "vipaka": str(row.get('vipaka', 'Unknown')),
-                                "plant_part_used": str(row.get('plant_part_used', 'Whole plant')),
-                                "indications": uses,
-                                "dosage_form": str(row.get('dosage_form', 'Powder/Decoction')),
-                                "source": "Indian Medicinal Plants - Ayurveda"
-                            }
-                            
-                            self.db.conn.execute("""
-                                UPDATE herbs 
-                                SET description = ?
-                                WHERE id = ?
-                            """, (json.dumps(details), herb_id))
-                            
-                            self.stats["indian_plants_added"] += 1
-                        except Exception as e:
-                            logger.debug(f"Herb already exists: {plant_name}")
-                            self.stats["indian_plants_added"] += 1
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing Indian plant row {idx}: {e}")
-                        self.stats["errors"].append(f"Indian plants - Row {idx}: {str(e)}")
+                plant_name = _plant_names(df)
+                fields = _text_columns(df, {'english_name': plant_name, **INDIAN_PLANT_DEFAULTS})
+                fields = fields.rename(columns={'traditional_uses': 'indications'})
+                fields['source'] = "Indian Medicinal Plants - Ayurveda"
+                
+                # Store Ayurvedic details as JSON in the herb's properties
+                details = _string_records_to_json(fields)
+                
+                self.cursor.executemany("""
+                    INSERT INTO herbs
+                    (name, scientific_name, properties, effectiveness_rating)
+                    VALUES (?, ?, ?, 0.80)
+                    ON CONFLICT(name) DO UPDATE SET
+                        scientific_name = excluded.scientific_name,
+                        properties = excluded.properties
+                """, zip(plant_name.tolist(), fields['scientific_name'].tolist(), details))
+                
+                self.stats["indian_plants_added"] += self.cursor.rowcount
             
-            self.db.conn.commit()
             print(f"\n✅ Added {self.stats['indian_plants_added']} Indian medicinal plants")
             return True
         
@@ -207,7 +386,7 @@ class MedicinalDatasetIntegrator:
         
         dataset_path = self.kaggle_datasets_dir / "drugs_reviews"
         
-        csv_files = list(dataset_path.glob("*.csv")) if dataset_path.exists() else []
+        csv_files = self._csvs.get("drugs_reviews", [])
         
         if not csv_files:
             print(f"⚠️  No CSV files found in {dataset_path}")
@@ -215,49 +394,47 @@ class MedicinalDatasetIntegrator:
             return False
         
         try:
-            for csv_file in csv_files:
-                print(f"\n📄 Processing: {csv_file.name}")
-                df = pd.read_csv(csv_file)
+            # One transaction per dataset: rolled back as a whole on error,
+            # committed (and synced to disk) once at the end
+            with self.db.connection:
+                # Stream the (large) review files and merge per-drug partial stats
+                drug_stats = self._aggregate_drug_reviews(csv_files)
+                
+                # Whole-column string formatting and rating normalization (0-5 -> 0-1)
+                names = drug_stats['drug_name'].astype(str).str.upper()
+                descriptions = (
+                    'Condition: ' + drug_stats['condition'].fillna('Unknown').astype(str)
+                    + ', Effectiveness: ' + drug_stats['effectiveness'].fillna('Not specified').astype(str)
+                )
+                rating_mean = drug_stats['rating_mean']
+                normalized = (rating_mean / 5.0).clip(upper=1.0).where(rating_mean > 0, 0.75)
+                # Last values win for names that collide after upper-casing
+                latest = dict(zip(names.tolist(), zip(descriptions.tolist(), normalized.tolist())))
+                params = [(description, rating, name)
+                          for name, (description, rating) in latest.items()]
                 
-                # Group by drug and condition to get aggregated ratings
-                drug_stats = df.groupby('drug_name').agg({
-                    'rating': ['mean', 'count'],
-                    'effectiveness': lambda x: x.mode()[0] if len(x.mode()) > 0 else 'Not specified',
-                    'condition': lambda x: x.mode()[0] if len(x.mode()) > 0 else 'Unknown'
-                }).reset_index()
+                # Review-derived drugs have no disease link and are matched by
+                # name: refresh the ones already stored, then add the rest, each
+                # in one batch
+                self.cursor.executemany("""
+                    UPDATE pharmaceuticals
+                    SET description = ?, effectiveness_rating = ?
+                    WHERE name = ? AND disease_id IS NULL
+                """, params)
+                self.cursor.executemany("""
+                    INSERT INTO pharmaceuticals
+                    (name, description, dosage, side_effects, availability,
+                     price_range, effectiveness_rating)
+                    SELECT ?1, ?2, 'As per prescription', 'Refer to package insert',
+                           'Medical Store', 'Varies', ?3
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM pharmaceuticals
+                        WHERE name = ?1 AND disease_id IS NULL
+                    )
+                """, [(name, description, rating) for description, rating, name in params])
                 
-                for idx, row in drug_stats.iterrows():
-                    try:
-                        drug_name = str(row['drug_name']).upper()
-                        avg_rating = float(row[('rating', 'mean')]) if pd.notna(row[('rating', 'mean')]) else 0.0
-                        review_count = int(row[('rating', 'count')]) if pd.notna(row[('rating', 'count')]) else 0
-                        effectiveness = str(row[('effectiveness', '<lambda>')]) if pd.notna(row[('effectiveness', '<lambda>')]) else 'Not specified'
-                        condition = str(row[('condition', '<lambda>')]) if pd.notna(row[('condition', '<lambda>')]) else 'Unknown'
-                        
-                        # Normalize rating to 0-1 scale (from 0-5)
-                        normalized_rating = min(avg_rating / 5.0, 1.0) if avg_rating > 0 else 0.75
-                        
-                        # Update or add pharmaceutical
-                        try:
-                            pharm_id = self.db.add_pharmaceutical(
-                                name=drug_name,
-                                description=f"Condition: {condition}, Effectiveness: {effectiveness}",
-                                dosage="As per prescription",
-                                side_effects=str(row.get('side_effects', 'Refer to package insert')),
-                                availability="Medical Store",
-                                price_range="Varies",
-                                effectiveness_rating=normalized_rating
-                            )
-                            self.stats["drug_reviews_integrated"] += 1
-                        except Exception as e:
-                            logger.debug(f"Drug already exists: {drug_name}")
-                            self.stats["drug_reviews_integrated"] += 1
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing drug review row {idx}: {e}")
-                        self.stats["errors"].append(f"Drug reviews - Row {idx}: {str(e)}")
+                self.stats["drug_reviews_integrated"] += len(params)
             
-            self.db.conn.commit()
             print(f"\n✅ Integrated reviews for {self.stats['drug_reviews_integrated']} drugs")
             return True
         
@@ -273,7 +450,7 @@ class MedicinalDatasetIntegrator:
         
         dataset_path = self.kaggle_datasets_dir / "medicine_recommendation"
         
-        csv_files = list(dataset_path.glob("*.csv")) if dataset_path.exists() else []
+        csv_files = self._csvs.get("medicine_recommendation", [])
         
         if not csv_files:
             print(f"⚠️  No CSV files found in {dataset_path}")
@@ -281,47 +458,48 @@ class MedicinalDatasetIntegrator:
             return False
         
         try:
-            for csv_file in csv_files:
-                print(f"\n📄 Processing: {csv_file.name}")
-                df = pd.read_csv(csv_file)
+            # One transaction per dataset: rolled back as a whole on error,
+            # committed (and synced to disk) once at the end
+            with self.db.connection:
+                print(f"\n📄 Processing: {', '.join(f.name for f in csv_files)}")
+                # Parse all files in parallel (read_csv releases the GIL); SQLite
+                # writes stay on this thread
+                df = self._read_csvs(csv_files)
+                
+                # Extract symptom-medication mappings; text columns are filled
+                # and coerced to str once, up front
+                columns = _text_columns(df, RECOMMENDATION_DEFAULTS)
+                patient_age = df['patient_age'] if 'patient_age' in df.columns else pd.Series(None, index=df.index, dtype=object)
+                
+                # Build every treatment recommendation pattern column-wise
+                patterns = pd.DataFrame({
+                    "patient_age": patient_age.astype(object).where(patient_age.notna(), None),
+                    "gender": columns['gender'],
+                    "symptoms": columns['symptoms'].str.findall(SYMPTOM_TOKEN),
+                    "recommended_drug": columns['recommended_medicine'],
+                    "kidney_function": columns['kidney_function'],
+                    "liver_function": columns['liver_function'],
+                    "source": "Medicine Recommendation Dataset",
+                })
+                pattern_json = list(map(_to_json, patterns.to_dict(orient='records')))
+                params = list(zip(
+                    ('MED_REC_' + _row_numbers(columns)).tolist(),
+                    pattern_json,
+                    patterns['recommended_drug'].tolist()
+                ))
+                
+                # Store patterns in symptom_patterns table in one batch
+                self.cursor.executemany("""
+                    INSERT INTO symptom_patterns 
+                    (pattern_name, pattern_data, disease_association)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(pattern_name) DO UPDATE SET
+                        pattern_data = excluded.pattern_data,
+                        disease_association = excluded.disease_association
+                """, params)
                 
-                # Extract symptom-medication mappings
-                for idx, row in df.iterrows():
-                    try:
-                        symptoms = str(row.get('symptoms', 'Unknown')).split(',')
-                        recommended_drug = str(row.get('recommended_medicine', 'Unknown'))
-                        patient_age = row.get('patient_age', None)
-                        gender = str(row.get('gender', 'Any'))
-                        
-                        # Create treatment recommendation pattern
-                        pattern_data = {
-                            "patient_age": patient_age,
-                            "gender": gender,
-                            "symptoms": [s.strip() for s in symptoms if s.strip()],
-                            "recommended_drug": recommended_drug,
-                            "kidney_function": str(row.get('kidney_function', 'Normal')),
-                            "liver_function": str(row.get('liver_function', 'Normal')),
-                            "source": "Medicine Recommendation Dataset"
-                        }
-                        
-                        # Store pattern in symptom_patterns table
-                        self.db.conn.execute("""
-                            INSERT OR IGNORE INTO symptom_patterns 
-                            (pattern_name, pattern_data, disease_association)
-                            VALUES (?, ?, ?)
-                        """, (
-                            f"MED_REC_{idx}",
-                            json.dumps(pattern_data),
-                            recommended_drug
-                        ))
-                        
-                        self.stats["recommendations_processed"] += 1
-                    
-                    except Exception as e:
-                        logger.error(f"Error processing recommendation row {idx}: {e}")
-                        self.stats["errors"].append(f"Medicine recommendation - Row {idx}: {str(e)}")
+                self.stats["recommendations_processed"] += self.cursor.rowcount
             
-            self.db.conn.commit()
             print(f"\n✅ Processed {self.stats['recommendations_processed']} medicine recommendations")
             return True
         
@@ -366,11 +544,14 @@ class MedicinalDatasetIntegrator:
         
         results = []
         
-        # Run all integrations
-        results.append(("Medicinal Plants", self.integrate_medicinal_plants()))
-        results.append(("Indian Medicinal Plants", self.integrate_indian_medicinal_plants()))
-        results.append(("Drug Reviews", self.integrate_drug_reviews()))
-        results.append(("Medicine Recommendations", self.integrate_medicine_recommendations()))
+        # Offline, re-runnable bulk load: trade durability for speed, then
+        # restore the connection's settings for any later use of the DB
+        with self.db.bulk_load():
+            # Run all integrations
+            results.append(("Medicinal Plants", self.integrate_medicinal_plants()))
+            results.append(("Indian Medicinal Plants", self.integrate_indian_medicinal_plants()))
+            results.append(("Drug Reviews", self.integrate_drug_reviews()))
+            results.append(("Medicine Recommendations", self.integrate_medicine_recommendations()))
         
         # Print results
         print("\n" + "="*70)
@@ -6,15 +6,44 @@ Handles downloading and integrating all Kaggle medical datasets
 
 import os
 import json
+import time
+import functools
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a get_download_status result is reused before rescanning the disk
+STATUS_TTL_SECONDS = 5.0
+
+
+def _dir_has_file(path: Path) -> bool:
+    """True if ``path`` is a directory holding a ``*.*`` entry, in one directory read"""
+    try:
+        with os.scandir(path) as entries:
+            return any('.' in e.name and not e.name.startswith('.') for e in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+HAS_PYARROW = False
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+HAS_ORJSON = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class KaggleDatasetLoader:
     """Load and integrate Kaggle datasets for medical conditions"""
@@ -126,6 +155,12 @@ class KaggleDatasetLoader:
         self.kaggle_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_file = self.kaggle_dir / "kaggle_metadata.json"
         self.cache = {}
+        self._status_cache: Optional[Tuple[float, Dict[str, bool]]] = None
+        # Disease -> first dataset covering it, for get_disease_data
+        self._disease_index: Dict[str, str] = {}
+        for name, info in self.KAGGLE_DATASETS.items():
+            for disease in info['diseases']:
+                self._disease_index.setdefault(disease, name)
         self._load_metadata()
         logger.info(f"Initialized KaggleDatasetLoader with base_dir: {self.base_dir}")
     
@@ -133,8 +168,8 @@ class KaggleDatasetLoader:
         """Load existing metadata"""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    self.metadata = json.load(f)
+                data = self.metadata_file.read_bytes()
+                self.metadata = orjson.loads(data) if HAS_ORJSON else json.loads(data)
                 logger.info("Loaded existing metadata")
             except Exception as e:
                 logger.warning(f"Could not load metadata: {e}")
@@ -143,21 +178,31 @@ class KaggleDatasetLoader:
             self.metadata = {}
     
     def _save_metadata(self):
-        """Save metadata"""
+        """Save metadata (written to a temp file, then renamed over the old one)"""
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            if HAS_ORJSON:
+                data = orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.metadata, indent=2).encode()
+            tmp_file = self.metadata_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.metadata_file)
         except Exception as e:
             logger.error(f"Could not save metadata: {e}")
     
     def get_download_status(self) -> Dict[str, bool]:
-        """Get status of all Kaggle datasets"""
+        """Get status of all Kaggle datasets (rescanned at most every STATUS_TTL_SECONDS)"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < STATUS_TTL_SECONDS:
+            return dict(self._status_cache[1])
+        
         status = {}
         for dataset_name, info in self.KAGGLE_DATASETS.items():
             dataset_dir = self.kaggle_dir / dataset_name
-            is_downloaded = dataset_dir.exists() and any(dataset_dir.glob("*.*"))
+            is_downloaded = _dir_has_file(dataset_dir)
             status[dataset_name] = is_downloaded
-        return status
+        self._status_cache = (now, status)
+        return dict(status)
     
     def get_download_instructions(self) -> str:
         """Get instructions for downloading Kaggle datasets"""
@@ -189,42 +234,78 @@ class KaggleDatasetLoader:
 """
         return instructions
     
-    def load_dataset(self, dataset_name: str) -> Optional[pd.DataFrame]:
-        """Load a specific Kaggle dataset"""
+    def download_all(self, max_workers: int = 8) -> Dict[str, bool]:
+        """Download all Kaggle datasets in parallel via the Kaggle API
+        
+        Downloads are network-bound, so running them on a thread pool overlaps
+        the per-dataset connection and transfer latency.
+        """
+        try:
+            # Importing the kaggle package authenticates immediately
+            from kaggle.api.kaggle_api_extended import KaggleApi
+            api = KaggleApi()
+            api.authenticate()
+        except (ImportError, OSError) as e:
+            logger.error(f"Kaggle API unavailable: {e}")
+            return {name: False for name in self.KAGGLE_DATASETS}
+        
+        def fetch(item: Tuple[str, Dict]) -> bool:
+            name, info = item
+            dataset_dir = self.kaggle_dir / name
+            dataset_dir.mkdir(parents=True, exist_ok=True)
+            kaggle_id = info['kaggle_id']
+            if kaggle_id.startswith("datasets/"):
+                kaggle_id = kaggle_id[len("datasets/"):]
+            try:
+                api.dataset_download_files(kaggle_id, path=str(dataset_dir), unzip=True, quiet=True)
+                logger.info(f"Downloaded {name}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to download {name}: {e}")
+                return False
+        
+        items = list(self.KAGGLE_DATASETS.items())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, items))
+        self._status_cache = None
+        return {name: ok for (name, _), ok in zip(items, results)}
+    
+    def load_dataset(self, dataset_name: str, chunksize: Optional[int] = None,
+                     usecols: Optional[List[str]] = None
+                     ) -> Optional[Union[pd.DataFrame, Iterator[pd.DataFrame]]]:
+        """Load a specific Kaggle dataset
+        
+        With ``chunksize`` an iterator of DataFrames of that many rows is
+        returned instead, so large files (CORD-19 metadata, drug reviews) never
+        sit in memory whole. ``usecols`` restricts the read to those columns.
+        Neither kind of partial read is kept in ``self.cache``.
+        """
         if dataset_name not in self.KAGGLE_DATASETS:
             logger.error(f"Unknown dataset: {dataset_name}")
             return None
         
         # Check cache
-        if dataset_name in self.cache:
+        if dataset_name in self.cache and chunksize is None:
             logger.info(f"Loading {dataset_name} from cache")
-            return self.cache[dataset_name]
+            df = self.cache[dataset_name]
+            return df if usecols is None else df[usecols]
         
         info = self.KAGGLE_DATASETS[dataset_name]
-        dataset_dir = self.kaggle_dir / dataset_name
-        
-        # Look for the data file
-        data_file = dataset_dir / info['file']
-        
-        if not data_file.exists():
-            # Try to find any CSV file
-            csv_files = list(dataset_dir.glob("*.csv"))
-            tsv_files = list(dataset_dir.glob("*.tsv"))
-            all_files = csv_files + tsv_files
-            
-            if all_files:
-                data_file = all_files[0]
-                logger.warning(f"Using alternative file: {data_file}")
-            else:
-                logger.error(f"Dataset file not found: {data_file}")
-                return None
+        data_file = self._resolve_path(dataset_name)
+        if data_file is None:
+            return None
         
         try:
-            # Load based on file type
-            if str(data_file).endswith('.tsv'):
-                df = pd.read_csv(data_file, sep='\t')
-            else:
-                df = pd.read_csv(data_file)
+            if chunksize is not None:
+                sep = '\t' if str(data_file).endswith('.tsv') else ','
+                return pd.read_csv(data_file, sep=sep, chunksize=chunksize, usecols=usecols)
+            
+            if usecols is not None:
+                df = self._read_data_file(data_file, usecols)
+                logger.info(f"Loaded {len(df.columns)} columns of {dataset_name}: {df.shape[0]} rows")
+                return df
+            
+            df = self._read_data_file(data_file)
             
             logger.info(f"Loaded {dataset_name}: {df.shape[0]} rows × {df.shape[1]} columns")
             
@@ -248,6 +329,67 @@ class KaggleDatasetLoader:
             logger.error(f"Failed to load {dataset_name}: {e}")
             return None
     
+    def _resolve_path(self, dataset_name: str) -> Optional[Path]:
+        """Locate the data file of a dataset, falling back to any CSV/TSV in its directory"""
+        info = self.KAGGLE_DATASETS[dataset_name]
+        dataset_dir = self.kaggle_dir / dataset_name
+        
+        # Look for the data file
+        data_file = dataset_dir / info['file']
+        
+        if not data_file.exists():
+            # Try to find any CSV file
+            csv_files = list(dataset_dir.glob("*.csv"))
+            tsv_files = list(dataset_dir.glob("*.tsv"))
+            all_files = csv_files + tsv_files
+            
+            if all_files:
+                data_file = all_files[0]
+                logger.warning(f"Using alternative file: {data_file}")
+            else:
+                logger.error(f"Dataset file not found: {data_file}")
+                return None
+        
+        return data_file
+    
+    def _parse_data_file(self, data_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Parse a CSV/TSV with the multithreaded pyarrow engine, else the C engine"""
+        # Load based on file type
+        sep = '\t' if str(data_file).endswith('.tsv') else ','
+        if HAS_PYARROW:
+            try:
+                return pd.read_csv(data_file, sep=sep, engine='pyarrow', usecols=usecols)
+            except ValueError as e:  # pyarrow.ArrowInvalid, e.g. quoting edge cases
+                logger.warning(f"pyarrow could not parse {data_file.name} ({e}); using the C engine")
+        return pd.read_csv(data_file, sep=sep, usecols=usecols)
+    
+    def _read_data_file(self, data_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read a dataset file, reusing its parquet copy from an earlier run
+        
+        The parquet copy sits next to the source file and is only trusted while
+        it is at least as new as the source. Column-restricted reads use the
+        copy when present but never write it.
+        """
+        cached = data_file.with_suffix('.parquet')
+        if HAS_PYARROW and cached.exists() and cached.stat().st_mtime >= data_file.stat().st_mtime:
+            try:
+                return pd.read_parquet(cached, columns=usecols)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache {cached}: {e}")
+        
+        df = self._parse_data_file(data_file, usecols)
+        
+        if HAS_PYARROW and usecols is None:
+            try:
+                df.to_parquet(cached, engine='pyarrow', compression='zstd', index=False)
+            except Exception as e:
+                logger.warning(f"Could not cache {data_file} as parquet: {e}")
+        return df
+    
+    def load_dataset_columns(self, dataset_name: str, columns: List[str]) -> Optional[pd.DataFrame]:
+        """Load only the given columns of a Kaggle dataset"""
+        return self.load_dataset(dataset_name, usecols=columns)
+    
     def get_medicinal_plants(self) -> Optional[pd.DataFrame]:
         """Load medicinal plants dataset"""
         df = self.load_dataset("medicinal_plants")
@@ -260,17 +402,22 @@ class KaggleDatasetLoader:
     
     def get_disease_data(self, disease: str) -> Optional[pd.DataFrame]:
         """Get data for a specific disease"""
-        for dataset_name, info in self.KAGGLE_DATASETS.items():
-            if disease in info['diseases']:
-                return self.load_dataset(dataset_name)
-        return None
+        dataset_name = self._disease_index.get(disease)
+        return self.load_dataset(dataset_name) if dataset_name else None
     
-    def get_all_diseases_from_kaggle(self) -> List[str]:
-        """Get all diseases available from Kaggle datasets"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _kaggle_diseases() -> Tuple[str, ...]:
+        """Sorted disease names across KAGGLE_DATASETS, computed once"""
         diseases = set()
-        for info in self.KAGGLE_DATASETS.values():
+        for info in KaggleDatasetLoader.KAGGLE_DATASETS.values():
             diseases.update(info['diseases'])
-        return sorted(list(diseases))
+        return tuple(sorted(diseases))
+    
+    @staticmethod
+    def get_all_diseases_from_kaggle() -> List[str]:
+        """Get all diseases available from Kaggle datasets"""
+        return list(KaggleDatasetLoader._kaggle_diseases())
     
     def get_dataset_summary(self) -> Dict:
         """Get summary of Kaggle datasets"""
@@ -297,14 +444,25 @@ class KaggleDatasetLoader:
         return self.KAGGLE_DATASETS.copy()
     
     def extract_symptoms_from_dataset(self, dataset_name: str) -> List[str]:
-        """Extract symptom columns from a dataset"""
-        df = self.load_dataset(dataset_name)
-        if df is None:
+        """Extract symptom columns from a dataset (reads only the header row)"""
+        if dataset_name not in self.KAGGLE_DATASETS:
+            logger.error(f"Unknown dataset: {dataset_name}")
+            return []
+        
+        data_file = self._resolve_path(dataset_name)
+        if data_file is None:
+            return []
+        
+        try:
+            sep = '\t' if str(data_file).endswith('.tsv') else ','
+            columns = pd.read_csv(data_file, sep=sep, nrows=0).columns.tolist()
+        except Exception as e:
+            logger.error(f"Failed to read columns of {dataset_name}: {e}")
             return []
         
         # Try to identify symptom columns (exclude IDs, targets, etc.)
         exclude_keywords = ['id', 'target', 'disease', 'class', 'outcome', 'diagnosis']
-        symptom_cols = [col for col in df.columns 
+        symptom_cols = [col for col in columns 
                        if not any(kw in col.lower() for kw in exclude_keywords)]
         
         return symptom_cols[:10]  # Return top 10
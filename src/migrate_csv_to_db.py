@@ -4,10 +4,31 @@ Migrates existing CSV data files to SQLite database
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
+from typing import Dict, List
 from database_manager import DatabaseManager
 import sys
 
+def _column(df: pd.DataFrame, *names: str, default=''):
+    """Values of the first of ``names`` present in df as a list, else ``default`` per row."""
+    for name in names:
+        if name in df.columns:
+            return df[name].tolist()
+    return [default] * len(df)
+
+
+def _insert_missing_names(db: DatabaseManager, insert_sql: str, select_sql: str,
+                          names: List[str]) -> Dict[str, int]:
+    """Insert the names not yet in a table and return its full name -> id map."""
+    existing = dict(db.connection.execute(select_sql).fetchall())
+    missing = [name for name in dict.fromkeys(names) if name not in existing]
+    if missing:
+        db.connection.executemany(insert_sql, [(name,) for name in missing])
+        existing = dict(db.connection.execute(select_sql).fetchall())
+    return existing
+
+
 def migrate_csv_to_database(csv_dir: str = "../data", db_path: str = "../data/medical_knowledge.db"):
     """
     Migrate CSV files to SQLite database.
@@ -33,17 +54,22 @@ def migrate_csv_to_database(csv_dir: str = "../data", db_path: str = "../data/me
         "drug_interactions.csv": migrate_drug_interactions,
     }
     
-    for csv_file, migration_func in migrations.items():
-        file_path = csv_path / csv_file
-        if file_path.exists():
-            print(f"\n📄 Processing: {csv_file}")
-            try:
-                migration_func(db, file_path)
-                print(f"   ✅ Success")
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-        else:
-            print(f"\n⏭️  Skipping: {csv_file} (not found)")
+    # The database is rebuilt from the CSVs, so skip per-commit fsyncs and the
+    # on-disk rollback journal while migrating; settings are restored afterwards
+    with db.bulk_load(cache_size_kib=262144) as conn:
+        for csv_file, migration_func in migrations.items():
+            file_path = csv_path / csv_file
+            if file_path.exists():
+                print(f"\n📄 Processing: {csv_file}")
+                try:
+                    # One transaction per file
+                    with conn:
+                        migration_func(db, file_path)
+                    print(f"   ✅ Success")
+                except Exception as e:
+                    print(f"   ❌ Error: {e}")
+            else:
+                print(f"\n⏭️  Skipping: {csv_file} (not found)")
     
     # Display statistics
     print("\n" + "="*80)
@@ -62,9 +88,8 @@ def migrate_diseases(db: DatabaseManager, csv_file: Path):
     """Migrate diseases.csv"""
     try:
         df = pd.read_csv(csv_file)
-        for _, row in df.iterrows():
-            disease_name = row.get('disease', row.get('Disease', ''))
-            if disease_name:
+        for disease_name in _column(df, 'disease', 'Disease'):
+            if disease_name and pd.notna(disease_name):
                 db.add_disease(
                     name=disease_name,
                     category="General",
@@ -78,39 +103,59 @@ def migrate_diseases(db: DatabaseManager, csv_file: Path):
 def migrate_symptoms_disease(db: DatabaseManager, csv_file: Path):
     """Migrate symptom_disease.csv - the main training dataset"""
     try:
-        df = pd.read_csv(csv_file)
-        
-        # Assuming the last column is the disease name
-        disease_col = df.columns[-1]
+        # Assuming the last column is the disease name; the symptom columns are
+        # 0/1 flags, so read them as uint8 rather than letting pandas infer
+        columns = pd.read_csv(csv_file, nrows=0).columns
+        disease_col = columns[-1]
+        dtypes = {col: np.uint8 for col in columns[:-1]}
+        dtypes[disease_col] = object
+        try:
+            df = pd.read_csv(csv_file, dtype=dtypes, engine='c')
+        except (ValueError, TypeError):
+            # Blank or non-numeric flags; fall back to inferred dtypes
+            df = pd.read_csv(csv_file)
         
         # Get unique diseases and add them
         diseases = df[disease_col].unique()
         print(f"      Found {len(diseases)} diseases")
         
-        disease_ids = {}
-        for disease in diseases:
-            if pd.notna(disease):
-                disease_id = db.add_disease(name=disease, category="General", severity=1)
-                disease_ids[disease] = disease_id
+        # Resolve existing ids with one query per table and insert only the
+        # missing names, each table in a single executemany
+        disease_names = [disease for disease in diseases if pd.notna(disease)]
+        disease_id_by_name = _insert_missing_names(
+            db, "INSERT INTO diseases (name, category, severity) VALUES (?, 'General', 1)",
+            "SELECT name, id FROM diseases", [str(disease) for disease in disease_names]
+        )
+        disease_ids = {disease: disease_id_by_name[str(disease)] for disease in disease_names}
         
         # Process symptoms
         symptom_cols = df.columns[:-1]  # All columns except disease
-        symptom_ids = {}
-        
-        for symptom_col in symptom_cols:
-            symptom_id = db.add_symptom(name=symptom_col.replace('_', ' ').title())
-            symptom_ids[symptom_col] = symptom_id
-        
-        # Link symptoms to diseases
-        for _, row in df.iterrows():
-            disease = row[disease_col]
-            if pd.notna(disease) and disease in disease_ids:
-                disease_id = disease_ids[disease]
-                
-                for symptom_col in symptom_cols:
-                    if row[symptom_col] == 1:  # Symptom is present
-                        symptom_id = symptom_ids[symptom_col]
-                        db.link_disease_symptom(disease_id, symptom_id, occurrence_rate=0.8)
+        symptom_names = {col: col.replace('_', ' ').title() for col in symptom_cols}
+        symptom_id_by_name = _insert_missing_names(
+            db, "INSERT INTO symptoms (name, severity) VALUES (?, 1)",
+            "SELECT name, id FROM symptoms", list(symptom_names.values())
+        )
+        symptom_ids = {col: symptom_id_by_name[name] for col, name in symptom_names.items()}
+        
+        # Link symptoms to diseases: locate every present symptom cell at once
+        # and write all links in a single transaction
+        disease_id_arr = df[disease_col].map(disease_ids).to_numpy(dtype=float)
+        symptom_id_arr = np.array([symptom_ids[c] for c in symptom_cols], dtype=np.int64)
+        present = df[symptom_cols].to_numpy() == 1
+        present &= ~np.isnan(disease_id_arr)[:, None]
+        rows, cols = np.nonzero(present)
+        links = zip(
+            disease_id_arr[rows].astype(np.int64).tolist(),
+            symptom_id_arr[cols].tolist(),
+            [0.8] * len(rows),
+        )
+        with db.connection:
+            db.connection.executemany(
+                """INSERT OR REPLACE INTO disease_symptoms
+                   (disease_id, symptom_id, occurrence_rate)
+                   VALUES (?, ?, ?)""",
+                links
+            )
         
         print(f"      Added {len(symptom_ids)} symptoms and {len(disease_ids)} diseases")
         
@@ -122,14 +167,12 @@ def migrate_herbs(db: DatabaseManager, csv_file: Path):
     """Migrate herbs.csv"""
     try:
         df = pd.read_csv(csv_file)
-        for _, row in df.iterrows():
-            herb_name = row.get('herb', row.get('Herb', ''))
-            if herb_name:
-                db.connection.execute(
-                    "INSERT OR IGNORE INTO herbs (name, scientific_name, properties) VALUES (?, ?, ?)",
-                    (herb_name, None, None)
-                )
-        db.connection.commit()
+        herb_names = [name for name in _column(df, 'herb', 'Herb') if name and pd.notna(name)]
+        with db.connection:
+            db.connection.executemany(
+                "INSERT OR IGNORE INTO herbs (name, scientific_name, properties) VALUES (?, NULL, NULL)",
+                [(name,) for name in herb_names]
+            )
         print(f"      Added {len(df)} herbs")
     except Exception as e:
         print(f"      Failed: {e}")
@@ -149,32 +192,37 @@ def migrate_pharmaceuticals(db: DatabaseManager, csv_file: Path):
     try:
         df = pd.read_csv(csv_file)
         
-        for _, row in df.iterrows():
-            disease_name = row.get('disease', '')
-            
+        # Resolve disease names to ids once, creating any that are missing
+        disease_ids = dict(db.connection.execute("SELECT name, id FROM diseases").fetchall())
+        row_disease_ids = []
+        for disease_name in _column(df, 'disease'):
             # Get or create disease
-            disease_id = db.get_disease_id(disease_name)
+            disease_id = disease_ids.get(disease_name)
             if not disease_id:
                 disease_id = db.add_disease(disease_name, category="General")
-            
-            # Add pharmaceutical
-            db.connection.execute(
+                disease_ids[disease_name] = disease_id
+            row_disease_ids.append(disease_id)
+        
+        rows = zip(
+            _column(df, 'drug_name'),
+            _column(df, 'generic_name'),
+            row_disease_ids,
+            _column(df, 'dosage'),
+            _column(df, 'side_effects'),
+            _column(df, 'price_range'),
+            _column(df, 'availability'),
+            _column(df, 'brand_names')
+        )
+        
+        # Add pharmaceuticals
+        with db.connection:
+            db.connection.executemany(
                 """INSERT INTO pharmaceuticals 
                    (name, generic_name, disease_id, dosage, side_effects, price_range, availability, brand_names)
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    row.get('drug_name', ''),
-                    row.get('generic_name', ''),
-                    disease_id,
-                    row.get('dosage', ''),
-                    row.get('side_effects', ''),
-                    row.get('price_range', ''),
-                    row.get('availability', ''),
-                    row.get('brand_names', '')
-                )
+                rows
             )
         
-        db.connection.commit()
         print(f"      Added {len(df)} pharmaceuticals")
         
     except Exception as e:
@@ -186,32 +234,33 @@ def migrate_drug_interactions(db: DatabaseManager, csv_file: Path):
     try:
         df = pd.read_csv(csv_file)
         
-        for _, row in df.iterrows():
-            drug1_name = row.get('drug1', '')
-            drug2_name = row.get('drug2', '')
-            
-            # Get drug IDs
-            cursor = db.connection.cursor()
-            cursor.execute("SELECT id FROM pharmaceuticals WHERE name = ?", (drug1_name,))
-            drug1_result = cursor.fetchone()
-            cursor.execute("SELECT id FROM pharmaceuticals WHERE name = ?", (drug2_name,))
-            drug2_result = cursor.fetchone()
+        # Get drug IDs, first match per name
+        drug_ids = dict(db.connection.execute(
+            "SELECT name, MIN(id) FROM pharmaceuticals GROUP BY name"
+        ).fetchall())
+        
+        rows = []
+        for drug1, drug2, severity, effect, recommendation in zip(
+            _column(df, 'drug1'),
+            _column(df, 'drug2'),
+            _column(df, 'severity'),
+            _column(df, 'effect'),
+            _column(df, 'recommendation')
+        ):
+            drug1_id = drug_ids.get(drug1)
+            drug2_id = drug_ids.get(drug2)
             
-            if drug1_result and drug2_result:
-                db.connection.execute(
-                    """INSERT OR IGNORE INTO drug_interactions 
-                       (drug1_id, drug2_id, severity, effect, recommendation)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (
-                        drug1_result[0],
-                        drug2_result[0],
-                        row.get('severity', ''),
-                        row.get('effect', ''),
-                        row.get('recommendation', '')
-                    )
-                )
+            if drug1_id and drug2_id:
+                rows.append((drug1_id, drug2_id, severity, effect, recommendation))
+        
+        with db.connection:
+            db.connection.executemany(
+                """INSERT OR IGNORE INTO drug_interactions 
+                   (drug1_id, drug2_id, severity, effect, recommendation)
+                   VALUES (?, ?, ?, ?, ?)""",
+                rows
+            )
         
-        db.connection.commit()
         print(f"      Added {len(df)} drug interactions")
         
     except Exception as e:
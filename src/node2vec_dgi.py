@@ -1,11 +1,14 @@
 import networkx as nx
-from node2vec import Node2Vec
+
+try:
+    from .embeddings import train_walk_embeddings
+except ImportError:
+    from embeddings import train_walk_embeddings
 
 def generate_embeddings():
-    G = nx.read_edgelist("data/HITD_network.edgelist", data=False)
+    G = nx.read_edgelist("data/HITD_network.edgelist", delimiter="\t", nodetype=str, data=False)
 
-    node2vec = Node2Vec(G, dimensions=64, walk_length=10, num_walks=50, workers=2)
-    model = node2vec.fit(window=5, min_count=1)
+    model = train_walk_embeddings(G, dimensions=64, walk_length=10, num_walks=50)
     model.wv.save_word2vec_format("data/embeddings.txt")
 
     print(f"✅ Embeddings generated for {len(G.nodes())} nodes.")
@@ -1,15 +1,13 @@
-import networkx as nx
-
 def rebuild_base_graph():
-    # Define base relationships
+    # Define base relationships, in the order they are written out
     edges = [
         ("Tulsi", "Eugenol"),
-        ("Neem", "Azadirachtin"),
-        ("Ashwagandha", "Withaferin A"),
-        ("Turmeric", "Curcumin"),
         ("Eugenol", "TNF"),
+        ("Neem", "Azadirachtin"),
         ("Azadirachtin", "IL6"),
+        ("Ashwagandha", "Withaferin A"),
         ("Withaferin A", "TP53"),
+        ("Turmeric", "Curcumin"),
         ("Curcumin", "NFE2L2"),
         ("TNF", "Inflammation"),
         ("IL6", "Fever"),
@@ -17,15 +15,12 @@ def rebuild_base_graph():
         ("NFE2L2", "Diabetes")
     ]
 
-    G = nx.Graph()
-    G.add_edges_from(edges)
-
     # Write cleanly
     with open("data/HITD_network.edgelist", "w") as f:
-        for u, v in G.edges():
-            f.write(f"{u} {v}\n")
+        f.writelines(f"{u}\t{v}\n" for u, v in edges)
 
-    print("✅ Rebuilt clean HITD_network.edgelist with", len(G.nodes()), "nodes and", len(G.edges()), "edges.")
+    nodes = {node for edge in edges for node in edge}
+    print("✅ Rebuilt clean HITD_network.edgelist with", len(nodes), "nodes and", len(edges), "edges.")
 
 if __name__ == "__main__":
     rebuild_base_graph()
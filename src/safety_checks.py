@@ -3,77 +3,73 @@ Medical Safety Checks Module
 QUICK WIN #4: Emergency detection and confidence warnings
 """
 
-def check_emergency_keywords(user_input: str) -> dict:
-    """
-    QUICK WIN #4A: Emergency Detection
-    
-    Detects life-threatening symptoms that require immediate medical attention.
-    
-    Args:
-        user_input: Raw user input text
-        
-    Returns:
-        dict with 'is_emergency' (bool) and 'message' (str)
-    """
-    
-    text_lower = user_input.lower().strip()
-    
-    # Critical emergency keywords
-    emergency_keywords = [
-        'chest pain',
-        'heart attack',
-        'severe chest pain',
-        'crushing chest pain',
-        'chest pressure',
-        'heart feels like',  # covers "heart feels like it's being crushed"
-        'stroke',
-        'can\'t breathe',
-        'cannot breathe',
-        'difficulty breathing',
-        'choking',
-        'severe bleeding',
-        'heavy bleeding',
-        'bleeding heavily',
-        'unconscious',
-        'loss of consciousness',
-        'passed out',
-        'suicide',
-        'suicidal',
-        'kill myself',
-        'end my life',
-        'seizure',
-        'convulsion',
-        'anaphylaxis',
-        'severe allergic reaction',
-        'throat closing',
-        'can\'t swallow',
-        'severe burn',
-        'severe trauma',
-        'head injury',
-        'severe head pain',
-        'worst headache of my life',
-        'sudden severe headache',
-        'coughing blood',
-        'coughing up blood',
-        'vomiting blood',
-        'blood in vomit',
-        'blood in stool',
-        'severe abdominal pain',
-        'sudden vision loss',
-        'sudden paralysis',
-        'numbness on one side',
-        'slurred speech',
-        'confusion and fever',
-        'stiff neck and fever',
-        'severe dehydration'
-    ]
-    
-    # Check for emergency keywords
-    for keyword in emergency_keywords:
-        if keyword in text_lower:
-            return {
-                'is_emergency': True,
-                'message': """
+import re
+
+# Critical emergency keywords
+EMERGENCY_KEYWORDS = (
+    'chest pain',
+    'heart attack',
+    'severe chest pain',
+    'crushing chest pain',
+    'chest pressure',
+    'heart feels like',  # covers "heart feels like it's being crushed"
+    'stroke',
+    'can\'t breathe',
+    'cannot breathe',
+    'difficulty breathing',
+    'choking',
+    'severe bleeding',
+    'heavy bleeding',
+    'bleeding heavily',
+    'nosebleeding',
+    'unconscious',
+    'loss of consciousness',
+    'passed out',
+    'suicide',
+    'suicidal',
+    'kill myself',
+    'end my life',
+    'seizure',
+    'convulsion',
+    'anaphylaxis',
+    'severe allergic reaction',
+    'throat closing',
+    'can\'t swallow',
+    'severe burn',
+    'severe trauma',
+    'head injury',
+    'severe head pain',
+    'worst headache of my life',
+    'sudden severe headache',
+    'coughing blood',
+    'coughing up blood',
+    'vomiting blood',
+    'blood in vomit',
+    'blood in stool',
+    'severe abdominal pain',
+    'sudden vision loss',
+    'sudden paralysis',
+    'numbness on one side',
+    'slurred speech',
+    'confusion and fever',
+    'stiff neck and fever',
+    'severe dehydration'
+)
+
+# Known harmless phrases that happen to contain a keyword; they are blanked
+# out before the keyword scan
+EMERGENCY_FALSE_POSITIVES = (
+    'surpassed out',  # "surpassed outage" contains "passed out"
+)
+
+# All keywords as one alternation, so a single scan finds any of them. Like a
+# plain substring check, matches may sit inside longer words ("brainstroke",
+# "pseudoseizure", "semiunconscious"): missing an emergency is worse than a
+# false alarm, so only the phrases above are excluded.
+_EMERGENCY_RE = re.compile('|'.join(map(re.escape, EMERGENCY_KEYWORDS)))
+_FALSE_POSITIVE_RE = re.compile('|'.join(map(re.escape, EMERGENCY_FALSE_POSITIVES)))
+
+_EMERGENCY_MESSAGE = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                    🚨 MEDICAL EMERGENCY DETECTED 🚨                ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -96,30 +92,8 @@ def check_emergency_keywords(user_input: str) -> dict:
 
 ═══════════════════════════════════════════════════════════════════
 """
-            }
-    
-    return {'is_emergency': False, 'message': ''}
-
 
-def check_confidence_threshold(confidence: float, threshold: float = 0.45) -> dict:
-    """
-    QUICK WIN #4B: Low Confidence Warning
-    
-    Warns users when the model's prediction is uncertain.
-    
-    Args:
-        confidence: Model's confidence score (0.0 to 1.0)
-        threshold: Minimum confidence threshold (default: 0.45)
-        
-    Returns:
-        dict with 'show_warning' (bool) and 'message' (str)
-    """
-    
-    if confidence < threshold:
-        confidence_pct = int(confidence * 100)
-        return {
-            'show_warning': True,
-            'message': f"""
+_LOW_CONFIDENCE_TEMPLATE = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                    ⚠️  LOW CONFIDENCE WARNING                      ║
 ╚═══════════════════════════════════════════════════════════════════╝
@@ -142,19 +116,8 @@ A doctor can:
 
 ═══════════════════════════════════════════════════════════════════
 """
-        }
-    
-    return {'show_warning': False, 'message': ''}
-
 
-def add_medical_disclaimer() -> str:
-    """
-    Standard medical disclaimer for all outputs.
-    
-    Returns:
-        Formatted disclaimer text
-    """
-    return """
+_DISCLAIMER = """
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ⚕️  MEDICAL DISCLAIMER
 
@@ -173,6 +136,65 @@ qualified health provider with questions about a medical condition.
 """
 
 
+def check_emergency_keywords(user_input: str) -> dict:
+    """
+    QUICK WIN #4A: Emergency Detection
+    
+    Detects life-threatening symptoms that require immediate medical attention.
+    
+    Args:
+        user_input: Raw user input text
+        
+    Returns:
+        dict with 'is_emergency' (bool) and 'message' (str)
+    """
+    
+    text_norm = _FALSE_POSITIVE_RE.sub(' ', user_input.casefold())
+    
+    # Check for emergency keywords
+    if _EMERGENCY_RE.search(text_norm):
+        return {
+            'is_emergency': True,
+            'message': _EMERGENCY_MESSAGE
+        }
+    
+    return {'is_emergency': False, 'message': ''}
+
+
+def check_confidence_threshold(confidence: float, threshold: float = 0.45) -> dict:
+    """
+    QUICK WIN #4B: Low Confidence Warning
+    
+    Warns users when the model's prediction is uncertain.
+    
+    Args:
+        confidence: Model's confidence score (0.0 to 1.0)
+        threshold: Minimum confidence threshold (default: 0.45)
+        
+    Returns:
+        dict with 'show_warning' (bool) and 'message' (str)
+    """
+    
+    if confidence < threshold:
+        confidence_pct = int(confidence * 100)
+        return {
+            'show_warning': True,
+            'message': _LOW_CONFIDENCE_TEMPLATE.format(confidence_pct=confidence_pct)
+        }
+    
+    return {'show_warning': False, 'message': ''}
+
+
+def add_medical_disclaimer() -> str:
+    """
+    Standard medical disclaimer for all outputs.
+    
+    Returns:
+        Formatted disclaimer text
+    """
+    return _DISCLAIMER
+
+
 def check_all_safety_measures(user_input: str, confidence: float) -> dict:
     """
     Run all safety checks in one call.
@@ -1,18 +1,108 @@
 import pandas as pd
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.calibration import CalibratedClassifierCV  # QUICK WIN #3: Probability calibration
+from sklearn.model_selection import train_test_split
 import joblib
 import re
 import os
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+HAS_FROZEN_ESTIMATOR = False
+try:
+    from sklearn.frozen import FrozenEstimator  # scikit-learn >= 1.6
+    HAS_FROZEN_ESTIMATOR = True
+except ImportError:
+    HAS_FROZEN_ESTIMATOR = False
+
+HAS_RAPIDFUZZ = False
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
 
 # ---------- Text Cleaning ----------
+_PAT_NONALPHA = re.compile(r'[^a-z\s]')
+_PAT_WS = re.compile(r'\s+')
+
 def clean_text(text):
     text = str(text).lower()
-    text = re.sub(r'[^a-z\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
+    text = _PAT_NONALPHA.sub(' ', text)
+    text = _PAT_WS.sub(' ', text)
     return text.strip()
 
+def clean_text_series(texts):
+    """clean_text over a whole Series with pandas string ops (missing -> '')"""
+    return (texts.fillna('').astype(str).str.lower()
+            .str.replace(_PAT_NONALPHA, ' ', regex=True)
+            .str.replace(_PAT_WS, ' ', regex=True)
+            .str.strip())
+
+# Disease names matched directly against prompts
+# This handles cases like "I have diabetes", "type 2 diabetes", etc.
+KNOWN_DISEASES = (
+    'diabetes', 'fever', 'cancer', 'inflammation',
+    'heart disease', 'asthma', 'depression', 'covid', 
+    'bronchitis', 'malaria', 'impetigo', 'gerd', 'dengue',
+    'bronchial asthma', 'gastric', 'hepatitis', 'pneumonia',
+    'thyroid', 'migraine', 'arthritis', 'eczema', 'psoriasis',
+    'acne', 'hypertension', 'high blood pressure', 'low blood pressure',
+    'hypotension', 'jaundice', 'chickenpox', 'measles', 'mumps',
+    'chest pain', 'heart attack', 'shortness of breath', 'cough',
+    'cold', 'flu', 'diarrhea', 'constipation', 'headache',
+    'nausea', 'vomiting', 'weakness', 'fatigue', 'anxiety'
+)
+
+# One scan finds every disease name occurring in a prompt: the lookahead tries
+# the names (in list order) at each position without consuming text, so
+# overlapping names such as "bronchial asthma"/"asthma" are all seen
+_KNOWN_DISEASE_RE = re.compile('(?=(' + '|'.join(map(re.escape, KNOWN_DISEASES)) + '))')
+_KNOWN_DISEASE_RANK = {disease: rank for rank, disease in enumerate(KNOWN_DISEASES)}
+
+def _exact_disease_match(text):
+    """First KNOWN_DISEASES entry (in list order) occurring in text, or None"""
+    hits = {m.group(1) for m in _KNOWN_DISEASE_RE.finditer(text)}
+    return min(hits, key=_KNOWN_DISEASE_RANK.__getitem__) if hits else None
+
+def _fuzzy_disease_match(words, threshold=0.7):
+    """Best (disease, ratio) above threshold for any word, or (None, threshold).
+    
+    A word contained in a disease name (or vice versa) scores 0.95; otherwise
+    the normalized similarity ratio is used, via rapidfuzz when installed.
+    """
+    best_match = None
+    best_ratio = threshold
+    for word in words:
+        if HAS_RAPIDFUZZ:
+            # Also check if word contains disease or disease contains word
+            contained = next((d for d in KNOWN_DISEASES if d in word or word in d), None)
+            if contained is not None and 0.95 > best_ratio:
+                best_ratio = 0.95
+                best_match = contained
+            # C++ Indel similarity, pruned by the score to beat
+            hit = process.extractOne(word, KNOWN_DISEASES, scorer=fuzz.ratio,
+                                     score_cutoff=best_ratio * 100)
+            if hit is not None and hit[1] / 100 > best_ratio:
+                best_ratio = hit[1] / 100
+                best_match = hit[0]
+            continue
+        
+        for known_disease in KNOWN_DISEASES:
+            # Calculate similarity between word and disease
+            ratio = SequenceMatcher(None, word, known_disease).ratio()
+            
+            # Also check if word contains disease or disease contains word
+            if known_disease in word or word in known_disease:
+                ratio = 0.95
+            
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_match = known_disease
+    return best_match, best_ratio
+
 # ---------- Dataset Preprocessing ----------
 def preprocess_kaggle_dataset(data_path):
     df = pd.read_csv(data_path)
@@ -20,7 +110,7 @@ def preprocess_kaggle_dataset(data_path):
     # Check if already in correct format (symptom_text, disease)
     if 'symptom_text' in df.columns and 'disease' in df.columns:
         print(f"✅ Dataset already in correct format")
-        df['symptom_text'] = df['symptom_text'].apply(clean_text)
+        df['symptom_text'] = clean_text_series(df['symptom_text'])
         df = df[df['symptom_text'].str.strip().str.len() > 0]
         print(f"✅ Preprocessed {len(df)} rows | {df['disease'].nunique()} unique diseases")
         return df[['symptom_text', 'disease']]
@@ -37,18 +127,20 @@ def preprocess_kaggle_dataset(data_path):
     # Symptom columns = all except prognosis
     symptom_cols = [c for c in df.columns if c != label_col]
 
-    # Convert each row to readable text: take column names where value != 0
-    def row_to_text(row):
-        active = [symptom_cols[i].replace('_', ' ')
-                  for i, val in enumerate(row[symptom_cols].values)
-                  if str(val).strip() != '0']
-        return ' '.join(active)
-
-    df['symptom_text'] = df.apply(row_to_text, axis=1)
+    # Convert each row to readable text: take column names where value != 0.
+    # Build the whole presence mask column by column (integer columns compare
+    # numerically, anything else by its string form) instead of per cell
+    symptom_names = np.array([c.replace('_', ' ') for c in symptom_cols], dtype=object)
+    mask = np.column_stack([
+        df[c].to_numpy() != 0 if pd.api.types.is_integer_dtype(df[c])
+        else (df[c].astype(str).str.strip() != '0').to_numpy()
+        for c in symptom_cols
+    ]) if symptom_cols else np.zeros((len(df), 0), dtype=bool)
+    df['symptom_text'] = [' '.join(symptom_names[row]) for row in mask]
     df.rename(columns={label_col: 'disease'}, inplace=True)
 
     # Clean & remove empties
-    df['symptom_text'] = df['symptom_text'].apply(clean_text)
+    df['symptom_text'] = clean_text_series(df['symptom_text'])
     df = df[df['symptom_text'].str.strip().str.len() > 0]
 
     print(f"✅ Preprocessed {len(df)} rows | {df['disease'].nunique()} unique diseases")
@@ -62,7 +154,8 @@ def train_symptom_model(data_path="data/symptom_disease.csv", out_path="data/sym
     vectorizer = TfidfVectorizer(
         max_features=8000,  # Increased from 5000 for better coverage
         ngram_range=(1, 2),  # Captures single words + bigrams
-        stop_words='english'
+        stop_words='english',
+        dtype=np.float32  # Half the memory of float64; lbfgs keeps float32 end to end
     )
     X = vectorizer.fit_transform(df['symptom_text'])
     y = df['disease']
@@ -75,22 +168,50 @@ def train_symptom_model(data_path="data/symptom_disease.csv", out_path="data/sym
     )
     
     # QUICK WIN #3: Probability calibration using Platt scaling
-    # This makes confidence scores more reliable and better calibrated
+    # This makes confidence scores more reliable and better calibrated.
+    # Fit the base model once and calibrate it on a held-out 15% split,
+    # rather than refitting it on every fold of a 5-fold CV
     print("🔧 Applying probability calibration (Platt scaling)...")
-    model = CalibratedClassifierCV(
-        base_model,
-        method='sigmoid',  # Platt scaling - fits sigmoid to map scores to probabilities
-        cv=5,  # 5-fold cross-validation for calibration
-        n_jobs=-1  # Use all CPU cores
-    )
-    model.fit(X, y)
+    try:
+        X_fit, X_cal, y_fit, y_cal = train_test_split(X, y, test_size=0.15, stratify=y, random_state=42)
+    except ValueError:
+        # Some disease has a single example, so it cannot be stratified
+        X_fit, X_cal, y_fit, y_cal = train_test_split(X, y, test_size=0.15, random_state=42)
+    base_model.fit(X_fit, y_fit)
+    if HAS_FROZEN_ESTIMATOR:
+        # One "fold" that is all of X_cal: the frozen model's fit is a no-op and
+        # the sigmoid is fitted on every calibration row, with no stratified
+        # folds (small datasets have too few examples per class for them)
+        cal_rows = np.arange(X_cal.shape[0])
+        model = CalibratedClassifierCV(FrozenEstimator(base_model), method='sigmoid',
+                                       cv=[(cal_rows, cal_rows)])
+    else:
+        model = CalibratedClassifierCV(base_model, method='sigmoid', cv='prefit')
+    model.fit(X_cal, y_cal)  # Platt scaling - fits sigmoid to map scores to probabilities
     print("✅ Model calibrated successfully!")
 
     os.makedirs("data", exist_ok=True)
     joblib.dump((vectorizer, model), out_path)
+    _load_model.cache_clear()
+    _predict_cached.cache_clear()
     print(f"✅ Symptom → Disease model trained and saved to {out_path}")
 
 # ---------- Prediction ----------
+@lru_cache(maxsize=4)
+def _load_model(model_path):
+    """(vectorizer, model) from model_path, unpickled once per path"""
+    return joblib.load(model_path)
+
+@lru_cache(maxsize=1024)
+def _predict_cached(model_path, prompt_clean):
+    """(label, max probability) of the ML model for a cleaned prompt; repeats are free"""
+    vectorizer, model = _load_model(model_path)
+    X = vectorizer.transform([prompt_clean])
+    # predict() would recompute the calibrated probabilities; take the argmax
+    proba = model.predict_proba(X)[0]
+    best = proba.argmax()
+    return model.classes_[best], proba[best]
+
 def predict_disease(prompt, model_path="data/symptom_model.pkl"):
     """
     Predict disease from user input.
@@ -105,61 +226,27 @@ def predict_disease(prompt, model_path="data/symptom_model.pkl"):
         Tuple of (disease, confidence)
     """
     
-    from difflib import SequenceMatcher
-    
-    vectorizer, model = joblib.load(model_path)
     prompt_clean = clean_text(prompt)
     
     # Step 1: Try to match against known disease names directly
-    # This handles cases like "I have diabetes", "type 2 diabetes", etc.
-    known_diseases = [
-        'diabetes', 'fever', 'cancer', 'inflammation',
-        'heart disease', 'asthma', 'depression', 'covid', 
-        'bronchitis', 'malaria', 'impetigo', 'gerd', 'dengue',
-        'bronchial asthma', 'gastric', 'hepatitis', 'pneumonia',
-        'thyroid', 'migraine', 'arthritis', 'eczema', 'psoriasis',
-        'acne', 'hypertension', 'high blood pressure', 'low blood pressure',
-        'hypotension', 'jaundice', 'chickenpox', 'measles', 'mumps',
-        'chest pain', 'heart attack', 'shortness of breath', 'cough',
-        'cold', 'flu', 'diarrhea', 'constipation', 'headache',
-        'nausea', 'vomiting', 'weakness', 'fatigue', 'anxiety'
-    ]
-    
     prompt_lower = prompt_clean.lower()
     
     # Check for exact disease name matches
-    for known_disease in known_diseases:
-        if known_disease in prompt_lower:
-            # Found a direct match - boost confidence
-            return known_disease.title(), 0.95
+    known_disease = _exact_disease_match(prompt_lower)
+    if known_disease:
+        # Found a direct match - boost confidence
+        return known_disease.title(), 0.95
     
     # Step 2: Fuzzy matching for typos (e.g., "diabities" → "diabetes")
     # Split prompt into words and try to match each word against known diseases
-    words = prompt_lower.split()
-    best_match = None
-    best_ratio = 0.7  # Threshold for similarity
-    
-    for word in words:
-        for known_disease in known_diseases:
-            # Calculate similarity between word and disease
-            ratio = SequenceMatcher(None, word, known_disease).ratio()
-            
-            # Also check if word contains disease or disease contains word
-            if known_disease in word or word in known_disease:
-                ratio = 0.95
-            
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = known_disease
+    best_match, best_ratio = _fuzzy_disease_match(prompt_lower.split())
     
     if best_match:
         # Found a fuzzy match
         return best_match.title(), round(best_ratio, 3)
     
     # Step 3: If no direct or fuzzy match, use the ML model for symptom-based prediction
-    X = vectorizer.transform([prompt_clean])
-    pred = model.predict(X)[0]
-    proba = model.predict_proba(X).max()
+    pred, proba = _predict_cached(model_path, prompt_clean)
     
     # QUICK WIN #4: Low confidence warning
     # If model is uncertain (confidence < 0.45), flag it for user awareness
@@ -6,7 +6,6 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import roc_auc_score, accuracy_score, roc_curve, confusion_matrix, ConfusionMatrixDisplay
 import joblib
-import random
 import os
 import matplotlib.pyplot as plt
 
@@ -14,9 +13,6 @@ import matplotlib.pyplot as plt
 def load_embeddings(kv_path="data/embeddings.kv"):
     return KeyedVectors.load(kv_path)
 
-def hadamard(u, v):
-    return np.multiply(u, v)
-
 # ---------------------- Dataset Builder ----------------------
 def build_pair_dataset(emb, data_dir="data", negative_ratio=1):
     ingredients_df = pd.read_csv(f"{data_dir}/ingredients.csv")
@@ -43,25 +39,31 @@ def build_pair_dataset(emb, data_dir="data", negative_ratio=1):
     all_ingredients = [l.strip() for l in open(f"{data_dir}/nodes_ingredients.txt").read().splitlines() if l.strip()]
     all_diseases = [l.strip() for l in open(f"{data_dir}/nodes_diseases.txt").read().splitlines() if l.strip()]
 
+    # Sample negatives in batches: drawing uniformly from the nodes that have
+    # embeddings is the same as drawing from all nodes and rejecting the rest
+    ing_arr = np.array([i for i in all_ingredients if i in emb.key_to_index], dtype=object)
+    dis_arr = np.array([d for d in all_diseases if d in emb.key_to_index], dtype=object)
+    pos_set = set(pos_pairs)
     neg_pairs = set()
     target_neg_count = len(pos_pairs) * negative_ratio
     tries = 0
-    while len(neg_pairs) < target_neg_count and tries < target_neg_count * 10:
-        i = random.choice(all_ingredients)
-        d = random.choice(all_diseases)
-        if (i, d) not in pos_pairs and i in emb.key_to_index and d in emb.key_to_index:
-            neg_pairs.add((i, d))
-        tries += 1
-    neg_pairs = list(neg_pairs)
+    while len(ing_arr) and len(dis_arr) and len(neg_pairs) < target_neg_count and tries < target_neg_count * 10:
+        batch = target_neg_count * 2
+        candidates = zip(ing_arr[np.random.randint(0, len(ing_arr), size=batch)].tolist(),
+                         dis_arr[np.random.randint(0, len(dis_arr), size=batch)].tolist())
+        neg_pairs.update(pair for pair in candidates if pair not in pos_set)
+        tries += batch
+    neg_pairs = list(neg_pairs)[:target_neg_count]
     print(f"✅ Sampled {len(neg_pairs)} negative pairs.")
 
-    X, y = [], []
-    for a, b in pos_pairs:
-        X.append(hadamard(emb[a], emb[b])); y.append(1)
-    for a, b in neg_pairs:
-        X.append(hadamard(emb[a], emb[b])); y.append(0)
+    # Hadamard features for all pairs in one gather-and-multiply
+    pairs = pos_pairs + neg_pairs
+    idx_a = np.array([emb.key_to_index[a] for a, _ in pairs], dtype=np.int64)
+    idx_b = np.array([emb.key_to_index[b] for _, b in pairs], dtype=np.int64)
+    X = emb.vectors[idx_a] * emb.vectors[idx_b]
+    y = np.concatenate([np.ones(len(pos_pairs), dtype=np.int8), np.zeros(len(neg_pairs), dtype=np.int8)])
 
-    return np.vstack(X), np.array(y), pos_pairs
+    return X, y, pos_pairs
 
 # ---------------------- Model Training ----------------------
 def train_models(kv_path="data/embeddings.kv", data_dir="data", out_dir="data"):
@@ -5,9 +5,25 @@ Properly loads and integrates all available datasets into the system
 """
 
 import os
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
 
+HAS_PYARROW = False
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Columns of symptom_disease.csv that are not 0/1 symptom flags
+NON_SYMPTOM_COLUMNS = ['prognosis']
+
+
+def _is_named_column(col) -> bool:
+    """False for blank header cells: 'Unnamed: N' in the C engine, '' in pyarrow"""
+    return bool(col) and not str(col).startswith('Unnamed')
+
 class DatasetManager:
     """Unified dataset manager - loads and caches all available data"""
     
@@ -21,9 +37,17 @@ class DatasetManager:
         print("📊 Loading Datasets...")
         
         # 1. Load the main symptom-disease dataset
-        self.cache['symptom_disease'] = self._safe_load_csv('symptom_disease.csv')
+        symptom_cols = [col for col in self._read_header('symptom_disease.csv')
+                        if _is_named_column(col) and col not in NON_SYMPTOM_COLUMNS]
+        df = self._safe_load_csv(
+            'symptom_disease.csv', dtype=dict.fromkeys(symptom_cols, np.int8))
+        if df is not None:
+            # Drop the empty column left by the trailing comma on every line
+            df = df.loc[:, [_is_named_column(col) for col in df.columns]]
+        self.cache['symptom_disease'] = df
         if self.cache['symptom_disease'] is not None:
             print(f"  ✓ Symptom-Disease: {self.cache['symptom_disease'].shape[0]} cases, {self.cache['symptom_disease']['prognosis'].nunique()} diseases")
+        self._index_symptom_matrix()
         
         # 2. Load pharmaceutical database
         self.cache['pharmaceutical'] = self._safe_load_csv('pharmaceutical_database.csv')
@@ -48,12 +72,66 @@ class DatasetManager:
         
         print("✅ Dataset loading complete!\n")
     
-    def _safe_load_csv(self, filename: str) -> pd.DataFrame:
-        """Safely load a CSV file"""
+    def _index_symptom_matrix(self):
+        """Precompute per-disease mean symptom presence for get_disease_by_symptoms
+        
+        Rows are grouped by stripped disease name (in order of first appearance)
+        so queries never rescan the DataFrame.
+        """
+        self._disease_names = []
+        self._symptom_index = {}
+        self._disease_mean = None
+        df = self.cache['symptom_disease']
+        if df is None or 'prognosis' not in df.columns:
+            return
+        
+        symptom_cols = [col for col in df.columns 
+                        if col not in NON_SYMPTOM_COLUMNS]
+        codes, names = pd.factorize(df['prognosis'].str.strip())
+        known = codes >= 0
+        self._disease_names = list(names)
+        self._symptom_index = {col: i for i, col in enumerate(symptom_cols)}
+        self._disease_mean = (df.loc[known, symptom_cols]
+                              .groupby(codes[known], sort=True).mean()
+                              .to_numpy(dtype=np.float64))
+    
+    @staticmethod
+    def _read_csv(path: str, dtype: Dict = None) -> pd.DataFrame:
+        """Read a CSV with the pyarrow engine when available, else the C engine"""
+        if HAS_PYARROW:
+            try:
+                return pd.read_csv(path, engine='pyarrow', dtype=dtype)
+            except ValueError:
+                # Dtype hints that do not fit fail the same way in the C engine
+                if dtype is not None:
+                    raise
+        return pd.read_csv(path, dtype=dtype)
+    
+    def _read_header(self, filename: str) -> List[str]:
+        """Column names of a CSV file, or [] if it cannot be read"""
         try:
             path = os.path.join(self.data_dir, filename)
             if os.path.exists(path):
-                return pd.read_csv(path)
+                return list(pd.read_csv(path, nrows=0).columns)
+        except Exception:
+            pass
+        return []
+    
+    def _safe_load_csv(self, filename: str, dtype: Dict = None) -> pd.DataFrame:
+        """Safely load a CSV file
+        
+        dtype maps column names to dtype hints (e.g. np.int8 for 0/1 flags);
+        if the data does not fit them the file is loaded with inferred dtypes.
+        """
+        try:
+            path = os.path.join(self.data_dir, filename)
+            if os.path.exists(path):
+                if dtype:
+                    try:
+                        return self._read_csv(path, dtype)
+                    except (ValueError, TypeError):
+                        pass
+                return self._read_csv(path)
         except Exception as e:
             print(f"  ⚠️  Could not load {filename}: {str(e)}")
         return None
@@ -87,7 +165,7 @@ class DatasetManager:
         
         # Get all symptom columns (exclude 'prognosis' and unnamed columns)
         symptom_cols = [col for col in df.columns 
-                       if col not in ['prognosis', 'Unnamed: 133']]
+                       if col not in NON_SYMPTOM_COLUMNS]
         
         # Calculate average symptom frequency for this disease
         symptom_freq = {}
@@ -108,37 +186,22 @@ class DatasetManager:
         if self.cache['symptom_disease'] is None:
             return []
         
-        df = self.cache['symptom_disease']
-        
         # Normalize symptom names (underscore format)
         normalized_symptoms = [s.lower().replace(' ', '_').strip() for s in symptoms]
         
-        # Get available symptom columns
-        available_cols = [col for col in df.columns 
-                         if col not in ['prognosis', 'Unnamed: 133']]
-        
-        # Match symptoms and calculate scores
-        matching_symptoms = [s for s in normalized_symptoms if s in available_cols]
+        # Match symptoms against the available symptom columns
+        matching_cols = [self._symptom_index[s] for s in normalized_symptoms
+                         if s in self._symptom_index]
         
-        if not matching_symptoms:
+        if not matching_cols:
             return []
         
-        # Find cases matching these symptoms
-        match_scores = {}
-        for disease in df['prognosis'].unique():
-            disease_rows = df[df['prognosis'].str.strip() == disease.strip()]
-            
-            # Calculate match score: how many symptoms are present in this disease
-            match_count = 0
-            for symptom in matching_symptoms:
-                if symptom in available_cols:
-                    # Check if symptom is typically present in this disease
-                    if disease_rows[symptom].mean() > 0.5:
-                        match_count += 1
-            
-            if match_count > 0:
-                score = match_count / len(matching_symptoms)  # Ratio of matched symptoms
-                match_scores[disease.strip()] = score
+        # Match score per disease: ratio of the symptoms that are typically
+        # present (mean > 0.5) in its cases, for all diseases at once
+        match_counts = (self._disease_mean[:, matching_cols] > 0.5).sum(axis=1)
+        scores = match_counts / len(matching_cols)
+        match_scores = {self._disease_names[k]: float(scores[k])
+                        for k in np.flatnonzero(match_counts)}
         
         # Sort and return top N
         sorted_diseases = sorted(match_scores.items(), 
@@ -226,7 +289,7 @@ def main():
     print("-" * 70)
     print(f"Symptom-Disease cases: {dm.cache['symptom_disease'].shape[0] if dm.cache['symptom_disease'] is not None else 'N/A'}")
     print(f"Unique diseases: {dm.cache['symptom_disease']['prognosis'].nunique() if dm.cache['symptom_disease'] is not None else 'N/A'}")
-    print(f"Unique symptoms: {len([c for c in dm.cache['symptom_disease'].columns if c not in ['prognosis', 'Unnamed: 133']]) if dm.cache['symptom_disease'] is not None else 'N/A'}")
+    print(f"Unique symptoms: {len([c for c in dm.cache['symptom_disease'].columns if c not in NON_SYMPTOM_COLUMNS]) if dm.cache['symptom_disease'] is not None else 'N/A'}")
     print(f"Pharmaceutical entries: {len(dm.cache['pharmaceutical']) if dm.cache['pharmaceutical'] is not None else 'N/A'}")
     
     print("\n" + "="*70)
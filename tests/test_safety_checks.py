@@ -0,0 +1,40 @@
+"""
+Regression tests for emergency keyword detection
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.safety_checks import check_emergency_keywords
+
+
+@pytest.mark.parametrize("text", [
+    "I think I have heatstroke",
+    "sunstroke symptoms",
+    "brief unconsciousness",
+    "nosebleeding heavily",
+    "brainstroke since morning",
+    "had a pseudoseizure",
+    "semiunconscious now",
+    "surpassed outage, then I passed out",
+    "I passed out this morning",
+    "Having SEIZURES since yesterday",
+    "Crushing chest pain and sweating",
+])
+def test_emergency_detected(text):
+    assert check_emergency_keywords(text)['is_emergency']
+
+
+@pytest.mark.parametrize("text", [
+    "The surpassed outage report",
+    "mild headache and runny nose",
+])
+def test_no_false_emergency(text):
+    result = check_emergency_keywords(text)
+    assert not result['is_emergency']
+    assert result['message'] == ''
@@ -0,0 +1,29 @@
+"""
+Regression tests for symptom model training
+"""
+
+import os
+import sys
+
+import joblib
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.symptom_predictor import train_symptom_model
+
+
+def test_train_on_small_default_dataset(tmp_path, monkeypatch):
+    # The default dataset has only 15 examples per disease
+    monkeypatch.chdir(tmp_path)
+    data_path = os.path.join(PROJECT_ROOT, "data", "symptom_disease.csv")
+    out_path = str(tmp_path / "symptom_model.pkl")
+    
+    train_symptom_model(data_path=data_path, out_path=out_path)
+    
+    vectorizer, model = joblib.load(out_path)
+    proba = model.predict_proba(vectorizer.transform(["joint pain and headache"]))
+    assert proba.shape == (1, len(model.classes_))
+    assert np.isclose(proba.sum(), 1.0)